@@ -7,7 +7,7 @@ enabling runtime language switching and fallback to English for missing keys.
 import os
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from threading import Lock
 
 import tomli
@@ -41,6 +41,8 @@ class TranslationLoader:
         # Cache for loaded translations
         self._translations_cache: Dict[str, Dict[str, Any]] = {}
         self._cache_lock = Lock()
+        # Cache for resolved keys, by (requested language code, key), fallbacks included
+        self._resolved_cache: Dict[Tuple[str, str], Any] = {}
         
         # Logger for translation operations
         self.logger = logging.getLogger(__name__)
@@ -123,6 +125,36 @@ class TranslationLoader:
         if language_code is None:
             language_code = self.current_language_code
 
+        cache_key = (language_code, key)
+        value = self._resolved_cache.get(cache_key)
+        if value is None:
+            value = self._resolve(key, language_code)
+            if value is None:
+                # Even English doesn't have the key, return the key itself
+                self.logger.warning(f"Translation key not found: {key}")
+                return key
+            self._resolved_cache[cache_key] = value
+        
+        # If we have a string, format it with any provided arguments
+        if isinstance(value, str) and kwargs:
+            try:
+                return value.format(**kwargs)
+            except (KeyError, ValueError) as e:
+                self.logger.warning(f"Failed to format translation '{key}': {e}")
+                return value
+        
+        return str(value)
+    
+    def _resolve(self, key: str, language_code: str) -> Any:
+        """Look up a key in a language, falling back to the default language.
+        
+        Args:
+            key (str): Translation key in dot notation.
+            language_code (str): Language code to look the key up in.
+            
+        Returns:
+            Any: The translation value, or None if the key is not found.
+        """
         # Ensure the language is loaded
         if language_code not in self._translations_cache:
             if not self._load_language(language_code):
@@ -137,24 +169,13 @@ class TranslationLoader:
         for part in key.split('.'):
             if isinstance(value, dict) and part in value:
                 value = value[part]
-            else:
+            elif language_code != self.default_language_code:
                 # Key not found, try fallback to English
-                if language_code != self.default_language_code:
-                    return self.translate(key, self.default_language_code, **kwargs)
-                else:
-                    # Even English doesn't have the key, return the key itself
-                    self.logger.warning(f"Translation key not found: {key}")
-                    return key
-        
-        # If we have a string, format it with any provided arguments
-        if isinstance(value, str) and kwargs:
-            try:
-                return value.format(**kwargs)
-            except (KeyError, ValueError) as e:
-                self.logger.warning(f"Failed to format translation '{key}': {e}")
-                return value
+                return self._resolve(key, self.default_language_code)
+            else:
+                return None
         
-        return str(value) if value is not None else key
+        return value
     
     def _load_language(self, language_code: str) -> bool:
         """Load a specific language into the cache.
@@ -203,6 +224,7 @@ class TranslationLoader:
         with self._cache_lock:
             cached_languages = list(self._translations_cache.keys())
             self._translations_cache.clear()
+            self._resolved_cache.clear()
         
         # Reload all previously cached languages
         for language_code in cached_languages:
@@ -8,19 +8,125 @@ import enum
 import re
 import json
 from pathlib import Path
+from types import MappingProxyType
 import tomli_w as toml_write
 import tomli as toml_read
-import yaml
-from typing import Dict, List, Tuple, Any, Optional, Union, get_origin, get_args
+from typing import Callable, Dict, Iterator, List, Tuple, Any, Optional, Union, get_origin, get_args
 from difflib import SequenceMatcher
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import FieldInfo
 
 from hatchling.config.settings import AppSettings, SettingAccessLevel
 from hatchling.config.llm_settings import ModelInfo, ELLMProvider, ModelStatus
 from hatchling.core.logging.logging_manager import logging_manager
 from hatchling.config.i18n import get_translation_loader, translate
 
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, indent=2)
+
+
+# PyYAML is only imported when the YAML format is used. The libyaml-based
+# classes are used when PyYAML was built with them.
+def _yaml_dumps(data: Dict[str, Any]) -> str:
+    import yaml
+    return yaml.dump(data, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), default_flow_style=False)
+
+
+def _yaml_loads(data: str) -> Any:
+    import yaml
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+# Serialization dispatch table: format name -> (encoder, decoder)
+_FORMATS = {
+    "toml": (toml_write.dumps, toml_read.loads),
+    "json": (_json_dumps, json.loads),
+    "yaml": (_yaml_dumps, _yaml_loads),
+}
+
+
+# Number of `list_settings` filters whose matches are kept
+_FILTER_CACHE_SIZE = 8
+
+
+def _get_field_access_level(field_info: FieldInfo) -> SettingAccessLevel:
+    """Get the access level declared on a settings field.
+
+    Args:
+        field_info (FieldInfo): Pydantic field definition.
+
+    Returns:
+        SettingAccessLevel: Declared access level, NORMAL if none is declared.
+    """
+    if getattr(field_info, 'json_schema_extra', None):
+        return field_info.json_schema_extra.get('access_level', SettingAccessLevel.NORMAL)
+    if 'access_level' in getattr(field_info, 'extra', {}):
+        return field_info.extra['access_level']
+    return SettingAccessLevel.NORMAL
+
+
+def _get_field_default(field_info: FieldInfo) -> Any:
+    """Get the default value of a settings field.
+
+    Default factories may depend on the environment, so they are evaluated on demand.
+
+    Args:
+        field_info (FieldInfo): Pydantic field definition.
+
+    Returns:
+        Any: The field's default value.
+    """
+    default_factory = getattr(field_info, 'default_factory', None)
+    return default_factory() if default_factory else field_info.default
+
+
+def _make_metadata_extractor(category_name: str, field_name: str, field_info: FieldInfo) -> Callable[[], Dict[str, Any]]:
+    """Build a metadata extractor for a single settings field.
+
+    Everything that only depends on the field definition (access level, translation
+    keys, type name, fallback description) is resolved once here; the returned
+    closure only performs the translations, which depend on the current language.
+
+    Args:
+        category_name (str): Name of the settings category owning the field.
+        field_name (str): Name of the field.
+        field_info (FieldInfo): Pydantic field definition.
+
+    Returns:
+        Callable[[], Dict[str, Any]]: Function returning the language-dependent field metadata.
+            The current and default values are placeholders, overlaid with live values on access.
+    """
+    access_level = _get_field_access_level(field_info)
+    fallback_description = field_info.description or ""
+    type_name = str(field_info.annotation)
+
+    name_key = f"settings.{category_name}.{field_name}.name"
+    desc_key = f"settings.{category_name}.{field_name}.description"
+    hint_key = f"settings.{category_name}.{field_name}.hint"
+
+    def extract() -> Dict[str, Any]:
+        description = translate(desc_key)
+        # Fall back to original description if translation key doesn't exist
+        if description == desc_key:
+            description = fallback_description
+        hint = translate(hint_key)
+
+        return {
+            "name": field_name,
+            "display_name": translate(name_key),
+            "current_value": None,
+            "default_value": None,
+            "description": description,
+            "hint": hint if hint != hint_key else "",
+            "access_level": access_level,
+            "type": type_name
+        }
+
+    return extract
+
+
 class SettingsRegistry:
     """Central registry for all settings categories and fields.
     
@@ -37,6 +143,30 @@ class SettingsRegistry:
         self.settings = app_settings or AppSettings()
         self.logger = logging_manager.get_session("hatchling.config.settings_registry")
         
+        # Per-category metadata extractors, specialized once from the field definitions
+        self._extractors: Dict[str, List[Tuple[str, FieldInfo, Callable[[], Dict[str, Any]]]]] = {
+            category_name: [
+                (field_name, field_info, _make_metadata_extractor(category_name, field_name, field_info))
+                for field_name, field_info in type(category_model).model_fields.items()
+            ]
+            for category_name, category_model in self.settings
+            if isinstance(category_model, BaseModel)
+        }
+        # Access levels indexed by category and field name, for checks that need no metadata
+        self._access_levels: Dict[str, Dict[str, SettingAccessLevel]] = {
+            category_name: {
+                field_name: _get_field_access_level(field_info)
+                for field_name, field_info in type(getattr(self.settings, category_name)).model_fields.items()
+            }
+            for category_name in self._extractors
+        }
+        
+        # Immutable metadata shared across calls, rebuilt when the language changes
+        self._meta_frozen: Optional[Dict[str, List[MappingProxyType]]] = None
+        self._meta_language: Optional[str] = None
+        # Matches of recently used filters, valid for the language of the frozen metadata
+        self._filter_matches: Dict[str, List[Tuple[FieldInfo, MappingProxyType]]] = {}
+        
         # Initialize translation loader with current language
         translation_loader = get_translation_loader()
         current_language = self.settings.ui.language_code
@@ -51,6 +181,7 @@ class SettingsRegistry:
         """List all settings with optional filtering.
         
         Implements staged search: exact match, category match, regex search, then fuzzy search.
+        The matches of recent filters are cached per language; current values are always live.
         
         Args:
             filter_regex (str, optional): Filter pattern for settings. Defaults to None.
@@ -58,59 +189,99 @@ class SettingsRegistry:
         Returns:
             List[Dict[str, Any]]: List of setting information dictionaries.
         """
-        all_settings = self._get_all_settings_metadata()
-        
         if not filter_regex:
-            return all_settings
+            return list(self._iter_settings_metadata())
+        
+        # Rebuilding the frozen metadata for a new language also drops the cached matches
+        frozen_metadata = self._get_frozen_metadata()
+        matches = self._filter_matches.get(filter_regex)
+        if matches is None:
+            matches = self._match_settings(filter_regex, frozen_metadata)
+            if len(self._filter_matches) >= _FILTER_CACHE_SIZE:
+                del self._filter_matches[next(iter(self._filter_matches))]
+            self._filter_matches[filter_regex] = matches
+        
+        return [
+            self._overlay_live_values(getattr(self.settings, frozen['category_name']), field_info, frozen)
+            for field_info, frozen in matches
+        ]
+    
+    def _match_settings(self, filter_regex: str,
+                        frozen_metadata: Dict[str, List[MappingProxyType]]) -> List[Tuple[FieldInfo, MappingProxyType]]:
+        """Run the staged search of `list_settings` over the frozen metadata.
+        
+        Only names and descriptions are searched, so the result holds until the language changes.
+        
+        Args:
+            filter_regex (str): Filter pattern for settings.
+            frozen_metadata (Dict[str, List[MappingProxyType]]): Frozen metadata per category.
+            
+        Returns:
+            List[Tuple[FieldInfo, MappingProxyType]]: Field definition and frozen metadata of each match.
+        """
+        all_settings = [
+            (field_info, frozen)
+            for category_name, extractors in self._extractors.items()
+            for (_, field_info, _), frozen in zip(extractors, frozen_metadata[category_name])
+        ]
         
         # Stage 1: Exact match (category or setting name)
-        exact_matches = []
-        for setting in all_settings:
+        for match in all_settings:
+            setting = match[1]
             if setting['category_name']+":"+setting['name'] == filter_regex:
-                return [setting]
+                return [match]
         
         # Stage 2: Category-wide listing
-        category_matches = []
-        for setting in all_settings:
-            if setting['category_name'] == filter_regex:
-                category_matches.append(setting)
-        
-        if category_matches:
-            return category_matches
+        matches = [match for match in all_settings if match[1]['category_name'] == filter_regex]
+        if matches:
+            return matches
         
         # Stage 3: Regex search
         try:
             regex_pattern = re.compile(filter_regex, re.IGNORECASE)
-            regex_matches = []
-            for setting in all_settings:
+        except re.error:
+            # Invalid regex, fall through to fuzzy search
+            regex_pattern = None
+        
+        if regex_pattern is not None:
+            for match in all_settings:
+                setting = match[1]
                 if (regex_pattern.search(setting['category_name']) or 
                     regex_pattern.search(setting['name']) or 
                     regex_pattern.search(setting['description'])):
-                    regex_matches.append(setting)
+                    matches.append(match)
             
-            if regex_matches:
-                return regex_matches
-        except re.error:
-            # Invalid regex, fall through to fuzzy search
-            pass
+            if matches:
+                return matches
         
         # Stage 4: Fuzzy search
         fuzzy_matches = []
-        for setting in all_settings:
+        filter_lower = filter_regex.lower()
+        for match in all_settings:
+            setting = match[1]
             search_text = f"{setting['category_name']} {setting['name']} {setting['description']}"
-            similarity = SequenceMatcher(None, filter_regex.lower(), search_text.lower()).ratio()
+            similarity = SequenceMatcher(None, filter_lower, search_text.lower()).ratio()
             if similarity > 0.3:  # Minimum similarity threshold
-                setting['_similarity'] = similarity
-                fuzzy_matches.append(setting)
+                fuzzy_matches.append((similarity, match))
         
         # Sort by similarity (highest first)
-        fuzzy_matches.sort(key=lambda x: x.get('_similarity', 0), reverse=True)
+        fuzzy_matches.sort(key=lambda fuzzy_match: fuzzy_match[0], reverse=True)
+        
+        return [match for _, match in fuzzy_matches]
+    
+    def get_setting_paths(self) -> List[str]:
+        """List the paths of all settings, in the same order as `list_settings`.
         
-        # Remove similarity score from results
-        for match in fuzzy_matches:
-            match.pop('_similarity', None)
+        The paths come from the field definitions, so no metadata is built.
         
-        return fuzzy_matches
+        Returns:
+            List[str]: Setting paths in 'category:name' format.
+        """
+        return [
+            f"{category_name}:{field_name}"
+            for category_name, fields in self._access_levels.items()
+            for field_name in fields
+        ]
     
     def get_setting(self, category: str, name: str) -> Dict[str, Any]:
         """Get metadata and value for a specific setting.
@@ -236,16 +407,11 @@ class SettingsRegistry:
             # Export only non-read-only settings
             settings_dict = self._get_exportable_settings()
         
-        settings_dict = self.make_serializable(settings_dict)
-        
-        if format.lower() == "toml":
-            return toml_write.dumps(settings_dict)
-        elif format.lower() == "json":
-            return json.dumps(settings_dict, indent=2)
-        elif format.lower() == "yaml":
-            return yaml.dump(settings_dict, default_flow_style=False)
-        else:
+        codec = _FORMATS.get(format.lower())
+        if codec is None:
             raise ValueError(f"Unsupported export format: {format}")
+        
+        return codec[0](self.make_serializable(settings_dict))
     
     def import_settings(self, data: str, format: str = "toml", force: bool = False) -> Dict[str, Any]:
         """Import settings from a formatted string.
@@ -261,16 +427,13 @@ class SettingsRegistry:
         Raises:
             ValueError: If format is not supported or data is invalid.
         """
+        codec = _FORMATS.get(format.lower())
+        if codec is None:
+            raise ValueError(f"Unsupported import format: {format}")
+        
         # Parse the data
         try:
-            if format.lower() == "toml":
-                parsed_data = toml_read.loads(data)
-            elif format.lower() == "json":
-                parsed_data = json.loads(data)
-            elif format.lower() == "yaml":
-                parsed_data = yaml.safe_load(data)
-            else:
-                raise ValueError(f"Unsupported import format: {format}")
+            parsed_data = codec[1](data)
         except Exception as e:
             raise ValueError(f"Failed to parse {format} data: {e}")
         
@@ -280,28 +443,11 @@ class SettingsRegistry:
             "failed": []
         }
         
-        # Import each category
+        # Import each category, validating all of its values in a single pass
         for category_name, category_data in parsed_data.items():
             if not isinstance(category_data, dict):
                 continue
-                
-            for setting_name, value in category_data.items():
-                try:
-                    self.set_setting(category_name, setting_name, value, force)
-                    report["successful"].append(f"{category_name}:{setting_name}")
-                except ValueError as e:
-                    if "read-only" in str(e):
-                        self.logger.warning(f"{category_name}:{setting_name} is read-only and cannot be modified --> skipped")
-                        report["skipped"].append(f"{category_name}:{setting_name} ({str(e)})")
-                    elif("protected" in str(e) and not force):
-                        self.logger.warning(f"{category_name}:{setting_name} is protected and cannot be modified without force --> skipped")
-                        report["skipped"].append(f"{category_name}:{setting_name} ({str(e)})")
-                    else:
-                        self.logger.error(f"Failed to set {category_name}:{setting_name} --> {str(e)}")
-                        report["failed"].append(f"{category_name}:{setting_name} ({str(e)})")
-                except Exception as e:
-                    self.logger.error(f"Unexpected error setting {category_name}:{setting_name} --> {str(e)}")
-                    report["failed"].append(f"{category_name}:{setting_name} ({str(e)})")
+            self._import_category(category_name, category_data, force, report)
         
         # Log the import operation
         self.logger.info(f"Settings import completed: {len(report['successful'])} successful, "
@@ -309,75 +455,155 @@ class SettingsRegistry:
         
         return report
     
+    def _import_category(self, category_name: str, category_data: Dict[str, Any], force: bool,
+                         report: Dict[str, List[str]]) -> None:
+        """Import the values of one settings category.
+        
+        Access control is checked per setting, then all accepted values are validated
+        together against the category model instead of revalidating it once per setting.
+        
+        Args:
+            category_name (str): Setting category name.
+            category_data (Dict[str, Any]): Setting names mapped to their new values.
+            force (bool): Force importing protected values.
+            report (Dict[str, List[str]]): Import report updated in place.
+        """
+        category_model = getattr(self.settings, category_name, None)
+        access_levels = self._access_levels.get(category_name, {})
+        updates = {}
+        
+        for setting_name, value in category_data.items():
+            setting_path = f"{category_name}:{setting_name}"
+            access_level = access_levels.get(setting_name)
+            
+            if access_level is None:
+                error = f"Setting '{setting_path}' not found"
+                self.logger.error(f"Failed to set {setting_path} --> {error}")
+                report["failed"].append(f"{setting_path} ({error})")
+            elif access_level == SettingAccessLevel.READ_ONLY:
+                self.logger.warning(f"{setting_path} is read-only and cannot be modified --> skipped")
+                report["skipped"].append(f"{setting_path} (Setting '{setting_path}' is read-only and cannot be modified)")
+            elif access_level == SettingAccessLevel.PROTECTED and not force:
+                self.logger.warning(f"{setting_path} is protected and cannot be modified without force --> skipped")
+                report["skipped"].append(f"{setting_path} (Setting '{setting_path}' is protected. Use --force to override)")
+            else:
+                try:
+                    updates[setting_name] = self._coerce_setting_value(category_name, category_model, setting_name, value)
+                except Exception as e:
+                    self.logger.error(f"Unexpected error setting {setting_path} --> {str(e)}")
+                    report["failed"].append(f"{setting_path} ({str(e)})")
+        
+        if not updates:
+            return
+        
+        # Validate every accepted value at once; drop the offending settings and retry
+        # once if some of them are rejected, so that the valid ones are still applied.
+        category_dict = category_model.model_dump()
+        try:
+            type(category_model)(**{**category_dict, **updates})
+        except ValidationError as e:
+            for error in e.errors():
+                setting_name = error["loc"][0] if error["loc"] else None
+                if setting_name in updates:
+                    del updates[setting_name]
+                    setting_path = f"{category_name}:{setting_name}"
+                    self.logger.error(f"Unexpected error setting {setting_path} --> {error['msg']}")
+                    report["failed"].append(f"{setting_path} ({error['msg']})")
+            try:
+                type(category_model)(**{**category_dict, **updates})
+            except ValidationError as e:
+                for setting_name in updates:
+                    self.logger.error(f"Unexpected error setting {category_name}:{setting_name} --> {str(e)}")
+                    report["failed"].append(f"{category_name}:{setting_name} ({str(e)})")
+                return
+        
+        for setting_name, value in updates.items():
+            old_value = getattr(category_model, setting_name)
+            setattr(category_model, setting_name, value)
+            self.logger.info(f"Setting '{category_name}:{setting_name}' changed from '{old_value}' to '{value}'")
+            report["successful"].append(f"{category_name}:{setting_name}")
+    
     def _get_all_settings_metadata(self) -> List[Dict[str, Any]]:
         """Get metadata for all settings with internationalized display names and descriptions.
 
         Returns:
             List[Dict[str, Any]]: List of metadata dictionaries for each setting.
         """
-        from pydantic import BaseModel
+        return list(self._iter_settings_metadata())
 
-        settings_list = []
+    def _iter_settings_metadata(self, category: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield the metadata of all settings, or of a single category.
 
-        # Iterate over the main settings model fields to get category names
-        for category_name, _category_model in iter(self.settings):
-            if not isinstance(_category_model, BaseModel):
-                continue  # Skip non-model fields
+        The yielded dictionaries are fresh copies of the frozen per-field metadata with the
+        live current and default values added; writes to them never reach the shared metadata.
 
-            category_model_class = type(_category_model)
-            
-            # Get translated category information
-            category_display_name = translate(f"settings.{category_name}.category_display_name")
-            category_description = translate(f"settings.{category_name}.category_description")
-            
-            for field_name, field_info in category_model_class.model_fields.items():
-                current_value = getattr(_category_model, field_name)
-                default_value = field_info.default
+        Args:
+            category (str, optional): Only yield the settings of this category. Defaults to None.
 
-                # Handle default_factory
-                if hasattr(field_info, 'default_factory') and field_info.default_factory:
-                    default_value = field_info.default_factory()
+        Yields:
+            Dict[str, Any]: Metadata dictionary for each setting.
+        """
+        if category is None:
+            categories = self._extractors.items()
+        elif category in self._extractors:
+            categories = ((category, self._extractors[category]),)
+        else:
+            return
 
-                # Get access level from field info
-                access_level = SettingAccessLevel.NORMAL
-                if hasattr(field_info, 'json_schema_extra') and field_info.json_schema_extra:
-                    access_level = field_info.json_schema_extra.get('access_level', SettingAccessLevel.NORMAL)
-                elif hasattr(field_info, 'extra') and 'access_level' in field_info.extra:
-                    access_level = field_info.extra['access_level']
+        frozen_metadata = self._get_frozen_metadata()
+        for category_name, extractors in categories:
+            category_model = getattr(self.settings, category_name)
 
-                # Get translated setting information
-                setting_name_key = f"settings.{category_name}.{field_name}.name"
-                setting_desc_key = f"settings.{category_name}.{field_name}.description"
-                setting_hint_key = f"settings.{category_name}.{field_name}.hint"
-                
-                setting_display_name = translate(setting_name_key)
-                setting_description = translate(setting_desc_key)
-                setting_hint = translate(setting_hint_key)
-                
-                # Fall back to original description if translation key doesn't exist
-                if setting_description == setting_desc_key:
-                    setting_description = field_info.description or ""
+            for (_, field_info, _), frozen in zip(extractors, frozen_metadata[category_name]):
+                yield self._overlay_live_values(category_model, field_info, frozen)
+
+    @staticmethod
+    def _overlay_live_values(category_model: BaseModel, field_info: FieldInfo,
+                             frozen: MappingProxyType) -> Dict[str, Any]:
+        """Overlay the live current and default values of a setting on its frozen metadata.
+
+        Args:
+            category_model (BaseModel): Settings category owning the field.
+            field_info (FieldInfo): Pydantic field definition.
+            frozen (MappingProxyType): Frozen metadata of the setting.
 
-                settings_list.append({
+        Returns:
+            Dict[str, Any]: Metadata dictionary for the setting.
+        """
+        return {
+            **frozen,
+            "current_value": getattr(category_model, frozen['name']),
+            "default_value": _get_field_default(field_info)
+        }
+
+    def _get_frozen_metadata(self) -> Dict[str, List[MappingProxyType]]:
+        """Get the immutable metadata of all settings for the current language.
+
+        Returns:
+            Dict[str, List[MappingProxyType]]: Frozen metadata per category, in field order.
+        """
+        current_language = get_translation_loader().get_current_language()
+        if self._meta_frozen is None or self._meta_language != current_language:
+            self._meta_frozen = {}
+            for category_name, extractors in self._extractors.items():
+                # Get translated category information
+                category_info = {
                     "category_name": category_name,
-                    "category_display_name": category_display_name,
-                    "category_description": category_description,
-                    "name": field_name,
-                    "display_name": setting_display_name,
-                    "current_value": current_value,
-                    "default_value": default_value,
-                    "description": setting_description,
-                    "hint": setting_hint if setting_hint != setting_hint_key else "",
-                    "access_level": access_level,
-                    "type": str(field_info.annotation) if hasattr(field_info, 'annotation') else str(type(current_value).__name__)
-                })
-        return settings_list
+                    "category_display_name": translate(f"settings.{category_name}.category_display_name"),
+                    "category_description": translate(f"settings.{category_name}.category_description"),
+                }
+                self._meta_frozen[category_name] = [
+                    MappingProxyType({**category_info, **extract()})
+                    for _, _, extract in extractors
+                ]
+            self._meta_language = current_language
+            self._filter_matches = {}
+        return self._meta_frozen
         
     def _get_setting_info(self, category: str, name: str) -> Optional[Dict[str, Any]]:
         """Get information for a specific setting."""
-        all_settings = self._get_all_settings_metadata()
-        for setting in all_settings:
-            if setting['category_name'] == category and setting['name'] == name:
+        for setting in self._iter_settings_metadata(category):
+            if setting['name'] == name:
                 return setting
         return None
     
@@ -398,9 +624,20 @@ class SettingsRegistry:
         if not hasattr(category_model, name):
             raise ValueError(f"Unknown setting: {name}")
         
+        value = self._coerce_setting_value(category, category_model, name, value)
+
         # Use Pydantic's validation by creating a new instance
         category_dict = category_model.model_dump()
+        category_dict[name] = value
+
+        # This will raise ValidationError if the value is invalid
+        new_category_model = type(category_model)(**category_dict)
+        
+        # If validation passes, update the actual model
+        setattr(category_model, name, value)
 
+    def _coerce_setting_value(self, category: str, category_model: BaseModel, name: str, value: Any) -> Any:
+        """Convert a raw (e.g. user-provided or deserialized) value to the field's type."""
         # if value is "None" (as a string), convert it to None
         if isinstance(value, str) and value.lower() == "none":
             value = None
@@ -408,7 +645,6 @@ class SettingsRegistry:
         # Convert to Enum if needed
         field_info = type(category_model).model_fields[name]
         field_type = field_info.annotation
-        import enum
         if isinstance(field_type, type) and issubclass(field_type, enum.Enum) and value is not None:
             if not isinstance(value, field_type):
                 self.logger.info(f"Converting value '{value}' to enum {field_type.__name__}")
@@ -425,13 +661,7 @@ class SettingsRegistry:
                 for item in value if isinstance(item, (list, tuple)) and len(item) >= 2
             ]
 
-        category_dict[name] = value
-
-        # This will raise ValidationError if the value is invalid
-        new_category_model = type(category_model)(**category_dict)
-        
-        # If validation passes, update the actual model
-        setattr(category_model, name, value)
+        return value
 
     # Language management methods
     
@@ -482,6 +712,7 @@ class SettingsRegistry:
         """Reload translation files from disk."""
         translation_loader = get_translation_loader()
         translation_loader.reload_translations()
+        self._meta_frozen = None
         self.logger.info("Translations reloaded")
 
     # File-based import/export methods
@@ -499,11 +730,10 @@ class SettingsRegistry:
         """
         try:
             path = Path(file_path)
-            allowed_formats = {"json", "toml", "yaml"}
             # Determine format and file path
             if format:
                 fmt = format.lower()
-                if fmt not in allowed_formats:
+                if fmt not in _FORMATS:
                     raise ValueError(f"Unsupported export format: {format}")
                 export_path = path.with_suffix(f".{fmt}")
             else:
@@ -519,18 +749,8 @@ class SettingsRegistry:
             # Export settings to string
             settings_data = self.export_settings(fmt, include_read_only)
 
-            # Write to file according to format
-            if fmt == "json":
-                with open(export_path, "w", encoding="utf-8") as f:
-                    f.write(settings_data)
-            elif fmt == "yaml":
-                with open(export_path, "w", encoding="utf-8") as f:
-                    f.write(settings_data)
-            elif fmt == "toml":
-                with open(export_path, "w", encoding="utf-8") as f:
-                    f.write(settings_data)
-            else:
-                raise ValueError(f"Unsupported export format: {fmt}")
+            with open(export_path, "w", encoding="utf-8") as f:
+                f.write(settings_data)
 
             self.logger.info(f"Settings exported to {export_path} in {fmt} format")
             return True
@@ -4,7 +4,9 @@ Provides functionality for tracking, storing, and managing chat message history
 including user messages, assistant responses, and tool interactions.
 """
 
-from typing import List, Dict, Any, Optional
+import time
+from collections import deque
+from typing import List, Dict, Any, FrozenSet, Optional
 from hatchling.core.logging.logging_manager import logging_manager
 from hatchling.core.llm.providers.registry import ProviderRegistry
 from hatchling.core.llm.event_system import EventSubscriber, Event, EventType
@@ -12,6 +14,9 @@ from hatchling.config.llm_settings import ELLMProvider
 
 from hatchling.core.llm.data_structures import ToolCallParsedResult, ToolCallExecutionResult
 
+# Number of history operations kept in the trace of a MessageHistory
+_TRACE_SIZE = 4096
+
 class MessageHistory(EventSubscriber):
     """Event-driven message history manager with canonical and provider-specific histories.
     
@@ -19,37 +24,46 @@ class MessageHistory(EventSubscriber):
     provider-specific histories based on the current LLM provider.
     """
     
+    __slots__ = (
+        "canonical_history", "provider_history", "_provider_histories", "_synced_lengths",
+        "_current_provider", "_content_buffer", "_trace", "logger",
+        "__weakref__",
+    )
+    
     def __init__(self):
         """Initialize an empty message history with dual-history support."""
         # Canonical history storing all events in normalized format
         self.canonical_history: List[Dict[str, Any]] = []
         
-        # Provider-specific history generated on demand
+        # Provider-specific history of the current provider
         self.provider_history: List[Dict[str, Any]] = []
         
+        # Histories of the providers used so far, with the number of canonical
+        # entries each one covers, so that only newer entries are formatted
+        self._provider_histories: Dict[ELLMProvider, List[Dict[str, Any]]] = {}
+        self._synced_lengths: Dict[ELLMProvider, int] = {}
+        
         # Current provider tracking for regeneration
         self._current_provider: Optional[ELLMProvider] = None
         
-        # Content buffer for assistant message assembly
-        self._content_buffer: str = ""
+        # Content chunks for assistant message assembly, joined on FINISH
+        self._content_buffer: List[str] = []
+        
+        # Trace of history operations as (monotonic_ns, operation, detail) tuples.
+        # Entries are only formatted by dump_trace, keeping message additions cheap.
+        self._trace: deque = deque(maxlen=_TRACE_SIZE)
         
         self.logger = logging_manager.get_session("MessageHistory")
     
-    def get_subscribed_events(self) -> List[EventType]:
-        """Return list of event types this subscriber handles.
+    def get_subscribed_events(self) -> FrozenSet[EventType]:
+        """Return the event types this subscriber handles.
+        
+        The publisher checks this set for every event, so it is built once.
         
         Returns:
-            List[EventType]: Event types for message history management.
+            FrozenSet[EventType]: Event types for message history management.
         """
-        return [
-            # LLM Response Events
-            EventType.CONTENT,
-            EventType.FINISH,
-            # Tool Execution Events
-            EventType.MCP_TOOL_CALL_DISPATCHED,
-            EventType.MCP_TOOL_CALL_RESULT,
-            EventType.MCP_TOOL_CALL_ERROR,
-        ]
+        return self._SUBSCRIBED_EVENTS
     
     def on_event(self, event: Event) -> None:
         """Handle stream events and update canonical history.
@@ -58,25 +72,18 @@ class MessageHistory(EventSubscriber):
             event (Event): The event to handle.
         """
         try:
-            # Check for provider change and regenerate provider history if needed
-            if event.provider != self._current_provider:
-                self._current_provider = event.provider
-                self._regenerate_provider_history()
-                self.logger.debug(f"Provider changed to {event.provider}, regenerated provider history")
+            # Check for provider change and switch to that provider's history if needed
+            # (providers are enum members, so identity is enough)
+            if event.provider is not self._current_provider:
+                self._switch_provider(event.provider)
+                self.logger.debug("Provider changed to %s, synced provider history", event.provider)
             
-            if event.type == EventType.CONTENT:
-                self._handle_content_event(event)
-            elif event.type == EventType.FINISH:
-                self._handle_finish_event(event)
-            elif event.type == EventType.MCP_TOOL_CALL_DISPATCHED:
-                self._handle_tool_call_dispatched_event(event)
-            elif event.type == EventType.MCP_TOOL_CALL_RESULT:
-                self._handle_tool_call_result_event(event)
-            elif event.type == EventType.MCP_TOOL_CALL_ERROR:
-                self._handle_tool_call_error_event(event)
+            handler = self._EVENT_HANDLERS.get(event.type)
+            if handler is not None:
+                handler(self, event)
                 
         except Exception as e:
-            self.logger.error(f"Error handling event {event.type}: {e}")
+            self.logger.error("Error handling event %s: %s", event.type, e)
     
     def _handle_content_event(self, event: Event) -> None:
         """Handle CONTENT events by buffering content for assistant message assembly.
@@ -85,8 +92,8 @@ class MessageHistory(EventSubscriber):
             event (Event): The CONTENT event.
         """
         content = event.data.get("content", "")
-        self._content_buffer += content
-        #self.logger.debug(f"Buffered content: {len(content)} chars (total buffer: {len(self._content_buffer)})")
+        if content:
+            self._content_buffer.append(content)
     
     def _handle_finish_event(self, event: Event) -> None:
         """Handle FINISH events by finalizing assistant message from buffer.
@@ -95,22 +102,15 @@ class MessageHistory(EventSubscriber):
             event (Event): The FINISH event.
         """
         if self._content_buffer:
-            # Add complete assistant message to canonical history
-            canonical_entry = {
-                "type": "assistant",
-                "data": {
-                    "role": "assistant",
-                    "content": self._content_buffer
-                }
-            }
-            self.canonical_history.append(canonical_entry)
+            content = "".join(self._content_buffer)
             
-            # Add to provider-specific history
-            provider_entry = {"role": "assistant", "content": self._content_buffer}
-            self.provider_history.append(provider_entry)
+            # The message is the same for every provider, so both histories share it
+            message = {"role": "assistant", "content": content}
+            self.canonical_history.append({"type": "assistant", "data": message})
+            self._sync_current_provider()
             
-            self.logger.debug(f"Added assistant message: {len(self._content_buffer)} chars")
-            self._content_buffer = ""  # Reset buffer
+            self._trace.append((time.monotonic_ns(), "assistant", len(content)))
+            self._content_buffer.clear()  # Reset buffer
 
     def _handle_tool_call_dispatched_event(self, event: Event) -> None:
         """Handle MCP_TOOL_CALL_DISPATCHED events by adding tool calls to history.
@@ -131,15 +131,9 @@ class MessageHistory(EventSubscriber):
             "data": tool_call
         }
         self.canonical_history.append(canonical_entry)
-
-        provider_entry = {
-            "role": "assistant",
-            "tool_calls": [ProviderRegistry.get_provider(self._current_provider).hatchling_to_llm_tool_call(tool_call)]
-        }
+        self._sync_current_provider()
         
-        self.provider_history.append(provider_entry)
-        
-        self.logger.debug(f"Added tool call: {tool_call.function_name}")
+        self._trace.append((time.monotonic_ns(), "tool_call", tool_call.function_name))
     
     def _handle_tool_call_result_event(self, event: Event) -> None:
         """Handle MCP_TOOL_CALL_RESULT events by adding tool results to history.
@@ -156,15 +150,9 @@ class MessageHistory(EventSubscriber):
             "data": tool_result
         }
         self.canonical_history.append(canonical_entry)
-
-        provider_entry = {
-            "role": "tool",
-            **ProviderRegistry.get_provider(self._current_provider).hatchling_to_provider_tool_result(tool_result)
-        }
-        
-        self.provider_history.append(provider_entry)
+        self._sync_current_provider()
         
-        self.logger.debug(f"Added tool result for: {tool_result.function_name}")
+        self._trace.append((time.monotonic_ns(), "tool_result", tool_result.function_name))
     
     def _handle_tool_call_error_event(self, event: Event) -> None:
         """Handle MCP_TOOL_CALL_ERROR events by adding error results to history.
@@ -183,44 +171,120 @@ class MessageHistory(EventSubscriber):
         self.canonical_history.append(canonical_entry)
         
         # Add to provider-specific history based on current provider
-        provider_entry = {
-            "role": "tool",
-            **ProviderRegistry.get_provider(self._current_provider).hatchling_to_provider_tool_result(tool_result)
-        }
+        self._sync_current_provider()
         
-        self.provider_history.append(provider_entry)
+        self._trace.append((time.monotonic_ns(), "tool_error", tool_result.function_name))
+    
+    # Event handlers by event type, looked up once per event by on_event
+    _EVENT_HANDLERS = {
+        EventType.CONTENT: _handle_content_event,
+        EventType.FINISH: _handle_finish_event,
+        EventType.MCP_TOOL_CALL_DISPATCHED: _handle_tool_call_dispatched_event,
+        EventType.MCP_TOOL_CALL_RESULT: _handle_tool_call_result_event,
+        EventType.MCP_TOOL_CALL_ERROR: _handle_tool_call_error_event,
+    }
+    
+    # LLM response events (CONTENT, FINISH) and tool execution events
+    _SUBSCRIBED_EVENTS = frozenset(_EVENT_HANDLERS)
+    
+    @staticmethod
+    def _render_tool_call(tool_call: ToolCallParsedResult, provider: ELLMProvider) -> Dict[str, Any]:
+        """Get the provider history entry of a tool call.
         
-        self.logger.debug(f"Added tool error for: {tool_result.function_name}")
+        Entries are cached on the tool call, so switching back to a provider
+        does not convert the same tool call again.
+        
+        Args:
+            tool_call (ToolCallParsedResult): The tool call.
+            provider (ELLMProvider): The provider to format for.
+            
+        Returns:
+            Dict[str, Any]: The assistant message carrying the tool call.
+        """
+        provider_entry = tool_call.provider_formats.get(provider)
+        if provider_entry is None:
+            provider_entry = {
+                "role": "assistant",
+                "tool_calls": [ProviderRegistry.get_provider(provider).hatchling_to_llm_tool_call(tool_call)]
+            }
+            tool_call.provider_formats[provider] = provider_entry
+        return provider_entry
     
-    def _regenerate_provider_history(self) -> None:
-        """Regenerate provider-specific history from canonical history."""
-        self.provider_history = []
+    @staticmethod
+    def _render_tool_result(tool_result: ToolCallExecutionResult, provider: ELLMProvider) -> Dict[str, Any]:
+        """Get the provider history entry of a tool result.
         
-        for entry in self.canonical_history:
-            entry_type = entry["type"]
+        Entries are cached on the tool result, so switching back to a provider
+        does not convert the same result again.
+        
+        Args:
+            tool_result (ToolCallExecutionResult): The tool result.
+            provider (ELLMProvider): The provider to format for.
             
-            if entry_type == "user":
-                provider_entry = entry["data"]
-            elif entry_type == "assistant":
-                provider_entry = entry["data"]
-            elif entry_type == "tool_call":
-                tool_call = entry["data"]
-                provider_entry = {
-                    "role": "assistant",
-                    "tool_calls": [ProviderRegistry.get_provider(self._current_provider).hatchling_to_llm_tool_call(tool_call)]
-                }
-            elif entry_type == "tool_result":
-                tool_result = entry["data"]
-                provider_entry = {
-                    "role": "tool",
-                    **ProviderRegistry.get_provider(self._current_provider).hatchling_to_provider_tool_result(tool_result)
-                }
-            else:
-                continue  # Skip unknown entry types
+        Returns:
+            Dict[str, Any]: The tool message carrying the result.
+        """
+        provider_entry = tool_result.provider_formats.get(provider)
+        if provider_entry is None:
+            # The provider returns a fresh dict, so it becomes the entry itself
+            provider_entry = ProviderRegistry.get_provider(provider).hatchling_to_provider_tool_result(tool_result)
+            provider_entry.setdefault("role", "tool")
+            tool_result.provider_formats[provider] = provider_entry
+        return provider_entry
+    
+    def _sync_provider_history(self, provider: ELLMProvider) -> List[Dict[str, Any]]:
+        """Bring the history of a provider up to date with the canonical history.
+        
+        Only the canonical entries its history does not cover yet are formatted;
+        a provider seen for the first time is built in full. An entry that cannot
+        be formatted for the provider is logged and left out of its history, but
+        still counts as synced so that it does not block the entries after it.
+        
+        Args:
+            provider (ELLMProvider): The provider to format for.
             
-            self.provider_history.append(provider_entry)
+        Returns:
+            List[Dict[str, Any]]: The messages formatted for the provider.
+        """
+        history = self._provider_histories.setdefault(provider, [])
+        synced_length = self._synced_lengths.get(provider, 0)
+        append = history.append
         
-        self.logger.debug(f"Regenerated provider history: {len(self.provider_history)} entries")
+        for entry in self.canonical_history[synced_length:]:
+            entry_type = entry["type"]
+            
+            try:
+                if entry_type == "user" or entry_type == "assistant":
+                    append(entry["data"])
+                elif entry_type == "tool_call":
+                    append(self._render_tool_call(entry["data"], provider))
+                elif entry_type == "tool_result":
+                    append(self._render_tool_result(entry["data"], provider))
+                # Unknown entry types are skipped, but still covered
+            except Exception as e:
+                self.logger.error("Skipping %s entry that cannot be formatted for %s: %s",
+                                  entry_type, provider.value, e)
+            synced_length += 1
+        
+        self._synced_lengths[provider] = synced_length
+        return history
+    
+    def _sync_current_provider(self) -> None:
+        """Extend the current provider's history with the canonical entries added since its last sync."""
+        if self._current_provider is not None:
+            self.provider_history = self._sync_provider_history(self._current_provider)
+    
+    def _switch_provider(self, provider: ELLMProvider) -> None:
+        """Make a provider current, syncing its history.
+        
+        Args:
+            provider (ELLMProvider): The new current provider.
+        """
+        history = self._sync_provider_history(provider)
+        self._current_provider = provider
+        self.provider_history = history
+        
+        self.logger.debug("Synced provider history: %d entries", len(self.provider_history))
     
     def add_user_message(self, content: str) -> None:
         """Add a user message to the history.
@@ -228,21 +292,16 @@ class MessageHistory(EventSubscriber):
         Args:
             content (str): The message content.
         """
-        # Add to canonical history
-        canonical_entry = {
-            "type": "user",
-            "data": {
-                "role": "user",
-                "content": content
-            }
-        }
-        self.canonical_history.append(canonical_entry)
-        
-        # Add to provider-specific history
-        provider_entry = {"role": "user", "content": content}
-        self.provider_history.append(provider_entry)
-        
-        self.logger.debug(f"MessageHistory - Added user message: {content}")
+        # The message is the same for every provider, so both histories share it
+        message = {"role": "user", "content": content}
+        self.canonical_history.append({"type": "user", "data": message})
+        if self._current_provider is None:
+            # Without a provider, the history is built from the canonical one on the first switch
+            self.provider_history.append(message)
+        else:
+            self._sync_current_provider()
+        
+        self._trace.append((time.monotonic_ns(), "user", len(content)))
 
     def get_canonical_history(self) -> List[Dict[str, Any]]:
         """Get the canonical (provider-agnostic) history.
@@ -262,36 +321,13 @@ class MessageHistory(EventSubscriber):
             List[Dict[str, Any]]: List of messages formatted for the specified provider.
         """
         if provider is None or provider == self._current_provider:
-            self.logger.debug(f"Returning current provider ({self._current_provider.value}) history")
+            self.logger.debug("Returning current provider (%s) history", self._current_provider)
             return self.provider_history
         
-        # Generate history for different provider without changing current state
-        self.logger.debug(f"Generating history for provider: {provider.value}")
-        temp_history = []
-        
-        for entry in self.canonical_history:
-            entry_type = entry["type"]
-            
-            if entry_type == "user":
-                temp_history.append(entry["data"])
-            elif entry_type == "assistant":
-                temp_history.append(entry["data"])
-            elif entry_type == "tool_call":
-                tool_call = entry["data"]
-                provider_entry = {
-                    "role": "assistant",
-                    "tool_calls": [ProviderRegistry.get_provider(self._current_provider).hatchling_to_llm_tool_call(tool_call)]
-                }
-                temp_history.append(provider_entry)
-            elif entry_type == "tool_result":
-                tool_result = entry["data"]
-                provider_entry = {
-                    "role": "tool",
-                    **ProviderRegistry.get_provider(self._current_provider).hatchling_to_provider_tool_result(tool_result)
-                }
-                temp_history.append(provider_entry)
-
-        return temp_history
+        # Sync history for different provider without changing current state;
+        # the caller gets a copy, so the kept history cannot be changed through it
+        self.logger.debug("Syncing history for provider: %s", provider)
+        return self._sync_provider_history(provider).copy()
     
     def copy(self) -> 'MessageHistory':
         """Create a copy of this message history.
@@ -299,22 +335,52 @@ class MessageHistory(EventSubscriber):
         Returns:
             MessageHistory: A new MessageHistory with the same canonical and provider histories.
         """
-        new_history = MessageHistory()
+        # Every attribute is set below, so the empty histories built by __init__ are skipped
+        new_history = type(self).__new__(type(self))
         new_history.canonical_history = self.canonical_history.copy()
-        new_history.provider_history = self.provider_history.copy()
+        new_history._provider_histories = {
+            provider: history.copy() for provider, history in self._provider_histories.items()
+        }
+        new_history._synced_lengths = self._synced_lengths.copy()
+        new_history.provider_history = new_history._provider_histories.get(
+            self._current_provider, self.provider_history.copy()
+        )
         new_history._current_provider = self._current_provider
-        new_history._content_buffer = self._content_buffer
+        new_history._content_buffer = self._content_buffer.copy()
+        new_history._trace = self._trace.copy()
+        new_history.logger = self.logger
         return new_history
     
     def clear(self) -> None:
         """Clear all histories."""
         self.canonical_history = []
         self.provider_history = []
-        self._content_buffer = ""
+        self._provider_histories = {}
+        self._synced_lengths = {}
+        self._content_buffer = []
         self._current_provider = None
+        self._trace.append((time.monotonic_ns(), "clear", 0))
         
         self.logger.info("MessageHistory - Cleared!")
     
+    def dump_trace(self) -> str:
+        """Format the trace of recent history operations.
+        
+        Message entries report their content length in characters, tool entries
+        the name of the tool.
+        
+        Returns:
+            str: One line per operation, oldest first, with times in milliseconds
+                relative to the first traced operation.
+        """
+        if not self._trace:
+            return ""
+        start = self._trace[0][0]
+        return "\n".join(
+            f"{(timestamp - start) / 1e6:10.3f} ms  {operation:<11} {detail}"
+            for timestamp, operation, detail in self._trace
+        )
+    
     def __len__(self) -> int:
         """Get the number of entries in canonical history.
         
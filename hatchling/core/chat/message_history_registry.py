@@ -7,7 +7,8 @@ across sessions, users, or contexts.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import List, Optional
+from weakref import WeakValueDictionary
 
 from hatchling.core.logging.logging_manager import logging_manager
 from .message_history import MessageHistory
@@ -27,10 +28,14 @@ class MessageHistoryRegistry:
     - Dynamic registration and lookup with async safety
     - Clear error handling for missing UIDs
     - Extensibility for future history management features
+    
+    The registry only holds weak references: a history stays registered while
+    something else (typically its ChatSession) keeps it alive, and drops out
+    once it is no longer used.
     """
 
     # Class-level storage for singleton behavior
-    _histories: Dict[str, MessageHistory] = {}
+    _histories: "WeakValueDictionary[str, MessageHistory]" = WeakValueDictionary()
 
     @classmethod
     def register_history(cls, uid: str, history: MessageHistory) -> None:
@@ -46,9 +51,9 @@ class MessageHistoryRegistry:
         if not isinstance(history, MessageHistory):
             raise TypeError(f"history must be a MessageHistory instance, got {type(history)}")
         if uid in cls._histories:
-            logger.warning(f"Overriding existing history for UID '{uid}'")
+            logger.warning("Overriding existing history for UID '%s'", uid)
         cls._histories[uid] = history
-        logger.debug(f"Registered history for UID '{uid}'")
+        logger.debug("Registered history for UID '%s'", uid)
 
     @classmethod
     def get_history(cls, uid: str) -> Optional[MessageHistory]:
@@ -67,6 +72,9 @@ class MessageHistoryRegistry:
     def get_or_create_history(cls, uid: str) -> MessageHistory:
         """Get a MessageHistory instance for the given UID, or create one if it doesn't exist.
         
+        Callers must keep a reference to a newly created history for it to stay
+        registered.
+        
         Args:
             uid (str): The UID to get or create a history for.
         
@@ -76,10 +84,12 @@ class MessageHistoryRegistry:
         history = cls._histories.get(uid)
         if history is not None:
             return history
-        history = MessageHistory()
-        cls._histories[uid] = history
-        logger.debug(f"Created and registered new history for UID '{uid}'")
-        return history    
+        # setdefault returns the history stored first if another caller won the race
+        new_history = MessageHistory()
+        history = cls._histories.setdefault(uid, new_history)
+        if history is new_history:
+            logger.debug("Created and registered new history for UID '%s'", uid)
+        return history
 
     @classmethod
     def unregister_history(cls, uid: str) -> Optional[MessageHistory]:
@@ -95,7 +105,7 @@ class MessageHistoryRegistry:
         """
         history = cls._histories.pop(uid, None)
         if history:
-            logger.debug(f"Unregistered history for UID '{uid}'")
+            logger.debug("Unregistered history for UID '%s'", uid)
         return history
 
     @classmethod
@@ -5,7 +5,7 @@ to avoid circular import dependencies.
 """
 
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # TODO: Standardize of dataclasses usage. Where to put them?
 # What to name them? Do we keep them as dataclasses or up to pydantic?
@@ -17,6 +17,8 @@ class ToolCallParsedResult:
     tool_call_id: str
     function_name: str
     arguments: Dict[str, Any]
+    # Cached provider-specific history entries, by provider
+    provider_formats: Dict[Any, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the parse result to a dictionary."""
@@ -35,6 +37,8 @@ class ToolCallExecutionResult:
     arguments: Dict[str, Any]
     result: Any
     error: Optional[str] = None
+    # Cached provider-specific history entries, by provider
+    provider_formats: Dict[Any, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the result to a dictionary."""
@@ -5,7 +5,7 @@ to participate in the publish-subscribe event system.
 """
 
 import logging
-from typing import List
+from typing import Collection
 from abc import ABC, abstractmethod
 
 from .event_data import Event, EventType
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 class EventSubscriber(ABC):
     """Abstract base class for event subscribers."""
     
+    # No instance state, so that subclasses may declare __slots__
+    __slots__ = ()
+    
     @abstractmethod
     def on_event(self, event: Event) -> None:
         """Handle an event.
@@ -25,10 +28,12 @@ class EventSubscriber(ABC):
         pass
     
     @abstractmethod
-    def get_subscribed_events(self) -> List[EventType]:
-        """Return list of event types this subscriber is interested in.
+    def get_subscribed_events(self) -> Collection[EventType]:
+        """Return the event types this subscriber is interested in.
+        
+        Any collection works, such as a list or a frozenset shared by all instances.
         
         Returns:
-            List[EventType]: Event types to subscribe to.
+            Collection[EventType]: Event types to subscribe to.
         """
         pass
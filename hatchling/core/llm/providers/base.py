@@ -227,5 +227,6 @@ class LLMProvider(ABC):
 
         Returns:
             Dict[str, Any]: LLM provider-specific representation of the tool result.
+                A new dictionary owned by the caller, which may add keys to it.
         """
         pass
\ No newline at end of file
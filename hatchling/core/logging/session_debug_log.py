@@ -7,7 +7,23 @@ outputs and stores logs in memory for easy retrieval during a session.
 import logging
 import io
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Tuple
+
+
+def _snapshot_args(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Capture log message arguments as they are when the message is logged.
+    
+    Arguments are stored unformatted and only converted to text by get_logs.
+    Lists, dicts and sets are shallow-copied so that later changes to them do
+    not show up in earlier entries; all other arguments are kept as they are.
+    
+    Args:
+        args (Tuple[Any, ...]): Values for the message placeholders.
+        
+    Returns:
+        Tuple[Any, ...]: Values for the placeholders.
+    """
+    return tuple(arg.copy() if isinstance(arg, (list, dict, set)) else arg for arg in args)
 
 
 class SessionDebugLog:
@@ -34,53 +50,60 @@ class SessionDebugLog:
         # Store the session name
         self.name = name
         
-        # Keep track of log entries for easy access by index
+        # Keep track of log entries for easy access by index, as
+        # (time, level, message, args) with messages formatted on retrieval
+        # from a snapshot of their arguments
         self.log_entries = []
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Log a debug message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, possibly with %-style placeholders.
+            *args: Values for the placeholders, formatted only when the message is output.
         """
-        self.logger.debug(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "DEBUG", message))
+        self.logger.debug(message, *args)
+        self.log_entries.append((datetime.now(), "DEBUG", message, _snapshot_args(args)))
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log an info message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, possibly with %-style placeholders.
+            *args: Values for the placeholders, formatted only when the message is output.
         """
-        self.logger.info(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "INFO", message))
+        self.logger.info(message, *args)
+        self.log_entries.append((datetime.now(), "INFO", message, _snapshot_args(args)))
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log a warning message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, possibly with %-style placeholders.
+            *args: Values for the placeholders, formatted only when the message is output.
         """
-        self.logger.warning(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "WARNING", message))
+        self.logger.warning(message, *args)
+        self.log_entries.append((datetime.now(), "WARNING", message, _snapshot_args(args)))
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log an error message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, possibly with %-style placeholders.
+            *args: Values for the placeholders, formatted only when the message is output.
         """
-        self.logger.error(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "ERROR", message))
+        self.logger.error(message, *args)
+        self.log_entries.append((datetime.now(), "ERROR", message, _snapshot_args(args)))
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Log a critical message.
         
         Args:
-            message (str): The message to log.
+            message (str): The message to log, possibly with %-style placeholders.
+            *args: Values for the placeholders, formatted only when the message is output.
         """
-        self.logger.critical(message)
-        self.log_entries.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S:%f"), "CRITICAL", message))
+        self.logger.critical(message, *args)
+        self.log_entries.append((datetime.now(), "CRITICAL", message, _snapshot_args(args)))
     
     def get_logs(self, last_n: Optional[int] = None) -> str:
         """Get formatted log entries, optionally limited to the last N entries.
@@ -99,8 +122,14 @@ class SessionDebugLog:
             entries = self.log_entries[-last_n:]
         
         result = f"=== SESSION DEBUG LOG: {self.name} ===\n"
-        for time, level, message in entries:
-            result += f"[{time}] {level}: {message}\n"
+        for time, level, message, args in entries:
+            if args:
+                try:
+                    message = message % args
+                except (TypeError, ValueError):
+                    # Like stdlib logging, a placeholder mismatch only affects its own entry
+                    message = f"{message} {args}"
+            result += f"[{time.strftime('%Y-%m-%d %H:%M:%S:%f')}] {level}: {message}\n"
         result += "======================\n"
         return result
     
@@ -5,7 +5,7 @@ and shared functionality for all command handlers in the chat interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional, Tuple, Union
 
 from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
@@ -13,6 +13,72 @@ from prompt_toolkit.styles import Style
 
 from hatchling.core.logging.logging_manager import logging_manager
 from hatchling.config.settings_registry import SettingsRegistry
+from hatchling.config.i18n import translate
+
+# Style class of command names, by command group
+COMMAND_NAME_STYLES = {
+    'base': 'class:command.name.base',
+    'hatch': 'class:command.name.hatch',
+}
+
+
+# Number of parsed argument strings remembered per compiled argument definitions
+_PARSE_CACHE_SIZE = 64
+
+
+class CompiledArgDefs(NamedTuple):
+    """Argument definitions of a command, in the form used to parse its arguments."""
+    defaults: Dict[str, Any]
+    positionals: Tuple[str, ...]
+    # Argument name or alias -> argument name
+    names: Dict[str, str]
+    # Argument string -> parsed arguments, oldest first
+    parsed: Dict[str, Dict[str, Any]]
+
+
+def compile_arg_defs(args: Dict[str, Dict[str, Any]]) -> CompiledArgDefs:
+    """Compile argument definitions for `AbstractCommands._parse_args`.
+    
+    Args:
+        args (Dict[str, Dict[str, Any]]): Argument definitions or metadata of a command,
+            as in its 'args' entry.
+            
+    Returns:
+        CompiledArgDefs: Argument definitions to parse arguments with.
+    """
+    names = {}
+    for arg_name, arg_def in args.items():
+        # The first argument declaring a name or alias takes it
+        names.setdefault(arg_name, arg_name)
+        for alias in arg_def.get('aliases', []):
+            names.setdefault(alias, arg_name)
+
+    return CompiledArgDefs(
+        defaults={arg_name: arg_def['default'] for arg_name, arg_def in args.items() if 'default' in arg_def},
+        positionals=tuple(arg_name for arg_name, arg_def in args.items() if arg_def.get('positional', False)),
+        names=names,
+        parsed={}
+    )
+
+
+def translate_arg_schema(arg_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the argument metadata for an argument schema, in the current language.
+    
+    Args:
+        arg_schema (Dict[str, Any]): Argument schema, with a 'description_key'
+            translation key in place of its 'description'.
+        
+    Returns:
+        Dict[str, Any]: The argument metadata, with its description translated.
+    """
+    arg_info = {}
+    for key, value in arg_schema.items():
+        if key == 'description_key':
+            arg_info['description'] = translate(value)
+        else:
+            arg_info[key] = value
+    return arg_info
+
 
 class AbstractCommands(ABC):
     """Abstract base class for chat command handlers.
@@ -21,6 +87,12 @@ class AbstractCommands(ABC):
     command handlers should implement. Subclasses must implement the abstract
     methods to define their specific commands and behavior.
     """
+
+    __slots__ = (
+        "chat_session", "settings_registry", "settings", "logger", "style",
+        "commands", "sync_commands", "async_commands", "_command_help",
+    )
+
     def __init__(self, chat_session,
                  settings_registry: SettingsRegistry, style: Optional[Style] = None):
         """Initialize the command handler.
@@ -48,6 +120,9 @@ class AbstractCommands(ABC):
         # Initialize the commands dictionary
         self.commands = {}
         
+        # Rendered usage help by command name, as (command info, formatted text)
+        self._command_help: Dict[str, Tuple[Dict[str, Any], FormattedText]] = {}
+        
         # Initialize the command registry
         self._register_commands()
         
@@ -78,13 +153,25 @@ class AbstractCommands(ABC):
     def print_commands_help(self) -> None:
         """Print help for all available commands.
         
-        Subclasses should implement this method to provide appropriate help text
-        for their command set.
+        The help is rendered by `render_commands_help` and written in a single call.
+        """
+        print_formatted_text(FormattedText(self.render_commands_help()), style=self.style, end='')
+
+    def render_commands_help(self) -> list:
+        """Render help for all available commands as FormattedText fragments.
+        
+        Subclasses can override this method to add a header to the help of
+        their command set.
+        
+        Returns:
+            list: FormattedText fragments, each line terminated by a newline.
         """
-        # Group commands by functionality and print them
+        fragments = []
+        
+        # Group commands by functionality
         for cmd_name, cmd_info in sorted(self.commands.items()):
-            formatted_cmd = self.format_command(cmd_name, cmd_info)
-            print_formatted_text(FormattedText(formatted_cmd), style=self.style)
+            fragments.extend(self.format_command(cmd_name, cmd_info))
+            fragments.append(('', '\n'))
             
             # Show arguments if available
             if cmd_info.get('args'):
@@ -93,13 +180,16 @@ class AbstractCommands(ABC):
                         ('', '\t'),
                         ('class:command.args', arg_name),
                         ('', ': '),
-                        ('class:command.description', arg_def.get('description', 'No description'))
+                        ('class:command.description', arg_def.get('description', 'No description')),
+                        ('', '\n')
                     ]
                     if arg_def.get('required'):
                         arg_text.insert(2, ('class:command.args', ' (required)'))
-                    print_formatted_text(FormattedText(arg_text), style=self.style)
+                    fragments.extend(arg_text)
+        
+        return fragments
 
-    def format_command(self, cmd_name: str, cmd_info: Dict[str, Any], group: str = 'default') -> list:
+    def format_command(self, cmd_name: str, cmd_info: Dict[str, Any], group: str = 'default') -> tuple:
         """Format a command as FormattedText.
         
         Can be overridden by subclasses to customize formatting.
@@ -110,13 +200,13 @@ class AbstractCommands(ABC):
             group (str): Command group name for styling
             
         Returns:
-            list: FormattedText fragments
+            tuple: FormattedText fragments
         """
-        return [
-            ('class:command.name', f"{cmd_name}"),
+        return (
+            ('class:command.name', cmd_name),
             ('', ' - '),
-            ('class:command.description', f"{cmd_info['description']}")
-        ]
+            ('class:command.description', cmd_info['description'])
+        )
     
     def reload_commands(self) -> Dict[str, Any]:
         """Reload all commands to apply the current language settings.
@@ -133,46 +223,65 @@ class AbstractCommands(ABC):
         Args:
             command (str): The command to print help for.
         """
-        if command in self.commands:
-            cmd_info = self.commands[command]
-            formatted_cmd = self.format_command(command, cmd_info)
-            print_formatted_text(FormattedText([('class:header', 'Command usage:')]), style=self.style)
-            print_formatted_text(FormattedText(formatted_cmd), style=self.style)
-            
-            # Show arguments if available
-            if cmd_info.get('args'):
-                
-                for arg_name, arg_def in cmd_info['args'].items():
-                    arg_text = [
-                        ('', '\t'),
-                        ('class:command.args', arg_name),
-                        ('', ': '),
-                        ('class:command.description', arg_def.get('description', 'No description'))
-                    ]
-                    if arg_def.get('required'):
-                        arg_text.insert(2, ('class:command.args', ' (required)'))
-                    print_formatted_text(FormattedText(arg_text), style=self.style)
+        cmd_info = self.commands.get(command)
+        if cmd_info is not None:
+            # Re-registering commands replaces their info, which invalidates the entry
+            cached = self._command_help.get(command)
+            if cached is None or cached[0] is not cmd_info:
+                cached = (cmd_info, self._render_command_help(command, cmd_info))
+                self._command_help[command] = cached
+            print_formatted_text(cached[1], style=self.style)
         else:
             print_formatted_text(FormattedText([
                 ('class:command.description', f"No help available for command: {command}")
             ]), style=self.style)
 
-    def _parse_args(self, args_str: str, arg_defs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def _render_command_help(self, command: str, cmd_info: Dict[str, Any]) -> FormattedText:
+        """Render the usage help of a command.
+        
+        Args:
+            command (str): The command name.
+            cmd_info (Dict[str, Any]): The command information.
+            
+        Returns:
+            FormattedText: The usage line followed by one line per argument.
+        """
+        fragments = [('class:header', 'Command usage:'), ('', '\n')]
+        fragments.extend(self.format_command(command, cmd_info))
+        
+        # Show arguments if available
+        for arg_name, arg_def in (cmd_info.get('args') or {}).items():
+            fragments.append(('', '\n\t'))
+            fragments.append(('class:command.args', arg_name))
+            if arg_def.get('required'):
+                fragments.append(('class:command.args', ' (required)'))
+            fragments.append(('', ': '))
+            fragments.append(('class:command.description', arg_def.get('description', 'No description')))
+        return FormattedText(fragments)
+
+    def _parse_args(self, args_str: str,
+                    arg_defs: Union[Dict[str, Dict[str, Any]], CompiledArgDefs]) -> Dict[str, Any]:
         """Parse command arguments from a string.
         
         Args:
             args_str (str): The argument string to parse.
-            arg_defs (Dict): Definitions of arguments to parse, including default values.
+            arg_defs (Union[Dict, CompiledArgDefs]): Definitions of arguments to parse, including
+                default values, possibly compiled ahead of time with `compile_arg_defs`.
+                Compiled definitions also remember the arguments they recently parsed.
             
         Returns:
             Dict[str, Any]: Parsed arguments.
         """
-        result = {}
-        
+        compiled = isinstance(arg_defs, CompiledArgDefs)
+        if compiled:
+            cached = arg_defs.parsed.get(args_str)
+            if cached is not None:
+                return dict(cached)
+        else:
+            arg_defs = compile_arg_defs(arg_defs)
+
         # Initialize with defaults
-        for arg_name, arg_def in arg_defs.items():
-            if 'default' in arg_def:
-                result[arg_name] = arg_def['default']
+        result = dict(arg_defs.defaults)
         
         # Split by spaces, but respect quoted strings
         parts = []
@@ -201,7 +310,7 @@ class AbstractCommands(ABC):
             parts.append(current_part)
         
         # Process positional and named arguments
-        positionals = [arg_name for arg_name, arg_def in arg_defs.items() if arg_def.get('positional', False)]
+        positionals = arg_defs.positionals
         positional_idx = 0
         
         i = 0
@@ -213,10 +322,7 @@ class AbstractCommands(ABC):
                 arg_name = part.lstrip('-')
                 
                 # Find the actual argument name if it's an alias
-                for name, arg_def in arg_defs.items():
-                    if arg_name == name or arg_name in arg_def.get('aliases', []):
-                        arg_name = name
-                        break
+                arg_name = arg_defs.names.get(arg_name, arg_name)
                 
                 # Check if this argument expects a value
                 if i + 1 < len(parts) and not parts[i+1].startswith('-'):
@@ -232,6 +338,14 @@ class AbstractCommands(ABC):
                     result[positionals[positional_idx]] = part
                     positional_idx += 1
                 i += 1
+
+        if compiled:
+            parsed = arg_defs.parsed
+            if len(parsed) >= _PARSE_CACHE_SIZE:
+                del parsed[next(iter(parsed))]
+            # Callers get their own copy, so the cached result stays intact
+            parsed[args_str] = result
+            return dict(result)
         
         return result
     
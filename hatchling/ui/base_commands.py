@@ -6,13 +6,10 @@ for the chat interface, including help, exit, log control and tool management.
 
 import logging
 
-from prompt_toolkit import print_formatted_text
-from prompt_toolkit.formatted_text import FormattedText
-
 from hatchling import __version__
 from hatchling.config.i18n import translate
 from hatchling.core.logging.logging_manager import logging_manager
-from hatchling.ui.abstract_commands import AbstractCommands
+from hatchling.ui.abstract_commands import AbstractCommands, COMMAND_NAME_STYLES
 
 
 class BaseChatCommands(AbstractCommands):
@@ -92,22 +89,20 @@ class BaseChatCommands(AbstractCommands):
             else:
                 self.sync_commands[cmd_name] = (cmd_info['handler'], cmd_info['description'])
     
-    def print_commands_help(self) -> None:
-        """Print help for all available chat commands."""
-        print_formatted_text(FormattedText([
-            ('class:header', "\n=== Base Chat Commands ===\n")
-        ]), style=self.style)
-
-        # Call parent class method to print formatted commands
-        super().print_commands_help()
+    def render_commands_help(self) -> list:
+        """Render help for all available chat commands, preceded by a header."""
+        return [
+            ('class:header', "\n=== Base Chat Commands ===\n"),
+            ('', '\n')
+        ] + super().render_commands_help()
 
-    def format_command(self, cmd_name: str, cmd_info: dict, group: str = 'base') -> list:
+    def format_command(self, cmd_name: str, cmd_info: dict, group: str = 'base') -> tuple:
         """Format base commands with custom styling."""
-        return [
-            (f'class:command.name.{group}', f"{cmd_name}"),
+        return (
+            (COMMAND_NAME_STYLES.get(group) or f'class:command.name.{group}', cmd_name),
             ('', ' - '),
-            ('class:command.description', f"{cmd_info['description']}")
-        ]
+            ('class:command.description', cmd_info['description'])
+        )
 
     def _cmd_help(self, _: str) -> bool:
         """
@@ -4,9 +4,13 @@ This module provides a central handler for all chat commands by combining
 base commands, Hatch-specific commands, and settings commands into a unified interface.
 """
 
-from typing import Tuple, Optional
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Optional
 
+from prompt_toolkit import print_formatted_text
 from prompt_toolkit.completion import FuzzyCompleter
+from prompt_toolkit.formatted_text import FormattedText
 from prompt_toolkit.styles import Style
 
 from hatchling.core.logging.logging_manager import logging_manager
@@ -16,14 +20,27 @@ from hatchling.config.settings_registry import SettingsRegistry
 from hatchling.mcp_utils.manager import mcp_manager
 from hatchling.ui.base_commands import BaseChatCommands
 from hatchling.ui.command_completion import CommandCompleter
-from hatchling.ui.command_lexer import ChatCommandLexer
+from hatchling.ui.command_lexer import ChatCommandLexer, compile_command_pattern
+from hatchling.ui.command_trie import CommandTrie
 from hatchling.ui.hatch_commands import HatchCommands
 from hatchling.ui.mcp_commands import MCPCommands
 from hatchling.ui.model_commands import ModelCommands
 from hatchling.ui.settings_commands import SettingsCommands
 
+# Longer command tokens are not interned, so that arbitrary input stays out of the intern table
+_INTERN_MAX_LENGTH = 40
+
 class ChatCommandHandler:
-    """Handles processing of command inputs in the chat interface."""    
+    """Handles processing of command inputs in the chat interface."""
+
+    __slots__ = (
+        "settings_registry", "base_commands", "hatch_commands", "settings_commands", "mcp_commands",
+        "model_commands", "_handlers", "_logger", "_lang_cache",
+        "commands", "_commands_view", "command_trie", "command_completer", "command_lexer",
+        "sync_commands", "async_commands", "_command_index", "_command_funcs",
+        "_command_is_async", "_help_text",
+    )
+
     def __init__(self, chat_session, settings_registry: SettingsRegistry, style: Optional[Style] = None):
         """Initialize the command handler.
         
@@ -32,55 +49,162 @@ class ChatCommandHandler:
             settings_registry (SettingsRegistry): The settings registry containing configuration.
             style (Optional[Style]): Style for formatting command output.
         """
-
-
         self.settings_registry = settings_registry
         self.base_commands = BaseChatCommands(chat_session, settings_registry, style)
         self.hatch_commands = HatchCommands(chat_session, settings_registry, style)
         self.settings_commands = SettingsCommands(chat_session, settings_registry, style)
         self.mcp_commands = MCPCommands(chat_session, settings_registry, style)
         self.model_commands = ModelCommands(chat_session, settings_registry, style)
-
-        self.logger = logging_manager.get_session("hatchling.core.chat.command_handler")
+        # Sub-handlers in registration order
+        self._handlers = (
+            self.base_commands, self.hatch_commands, self.settings_commands,
+            self.mcp_commands, self.model_commands
+        )
+        # Command tables already built, by language code
+        self._lang_cache = {}
+        # Only needed on error paths, so created on first use
+        self._logger = None
 
         self._register_commands()
-    
+
+    @property
+    def logger(self):
+        """Logger of the command handler, created on first access."""
+        if self._logger is None:
+            self._logger = logging_manager.get_session("hatchling.core.chat.command_handler")
+        return self._logger
+
     def _register_commands(self) -> None:
-        """Register all available chat commands with their handlers."""
+        """Register all available chat commands with their handlers.
+        
+        The command tables are built once per language; switching back to a language
+        that was already used restores its tables instead of rebuilding them.
+        """
+        language_code = self.settings_registry.get_current_language()
+        cached = self._lang_cache.get(language_code)
+        if cached is not None:
+            self._carry_over_values(cached[1])
+            (handler_commands, self.commands, self._commands_view, self.command_trie,
+             self.command_completer, self.command_lexer, self.sync_commands, self.async_commands, self._command_index,
+             self._command_funcs, self._command_is_async, self._help_text) = cached
+            # Sub-handlers print their own help from their commands
+            for handler, commands in zip(self._handlers, handler_commands):
+                handler.commands = commands
+            return
+
+        self._build_command_tables()
+        self._lang_cache[language_code] = (
+            tuple(handler.commands for handler in self._handlers),
+            self.commands, self._commands_view, self.command_trie, self.command_completer,
+            self.command_lexer, self.sync_commands, self.async_commands, self._command_index,
+            self._command_funcs, self._command_is_async, self._help_text
+        )
+
+    def _carry_over_values(self, commands: Dict[str, Dict[str, Any]]) -> None:
+        """Copy the current argument suggestions into the command table of another language.
+        
+        Suggested values are not translated, but sub-handlers update some of them in place
+        (e.g. model names after a pull), so a restored table takes the current ones.
+        
+        Args:
+            commands (Dict[str, Dict[str, Any]]): Combined command metadata being restored.
+        """
+        for cmd_name, cmd_info in self.commands.items():
+            restored_info = commands.get(cmd_name)
+            if restored_info is None:
+                continue
+            restored_args = restored_info['args']
+            for arg_name, arg_info in cmd_info['args'].items():
+                if 'values' in arg_info and arg_name in restored_args:
+                    restored_args[arg_name]['values'] = arg_info['values']
+
+    def _build_command_tables(self) -> None:
+        """Build the command table, completer and lexer from all sub-handlers."""
         # Combine all commands from all handlers
         self.commands = {}
-        self.commands.update(self.base_commands.reload_commands())
-        self.commands.update(self.hatch_commands.reload_commands())
-        self.commands.update(self.settings_commands.reload_commands())
-        self.commands.update(self.mcp_commands.reload_commands())
-        self.commands.update(self.model_commands.reload_commands())
-
-        self.command_completer = FuzzyCompleter(CommandCompleter(self.commands, mcp_manager.hatch_env_manager))
-        self.command_lexer = ChatCommandLexer(self.commands)
-        
-        # Keep old format for backward compatibility
+        # Keep old format for backward compatibility (command name -> handler)
         self.sync_commands = {}
         self.async_commands = {}
+        for handler in self._handlers:
+            self._absorb(handler.reload_commands())
+
+        # Read-only view handed out to consumers, so that the tables derived from
+        # the commands below cannot go stale through outside mutation
+        self._commands_view = MappingProxyType(self.commands)
+
+        # Prefix tree for completion, and a single compiled pattern for highlighting
+        self.command_trie = CommandTrie(self.commands.items())
+
+        self.command_completer = FuzzyCompleter(CommandCompleter(self._commands_view, mcp_manager.hatch_env_manager, self.command_trie))
+        self.command_lexer = ChatCommandLexer(self._commands_view, compile_command_pattern(self.commands))
+
+        # Dispatch table as parallel arrays indexed through command name -> position.
+        # Commands that concern all sub-handlers are handled here rather than by their owner.
+        overrides = {"help": self._cmd_help, "settings:language:set": self._cmd_language_set}
+        self._command_index = {}
+        self._command_funcs = []
+        self._command_is_async = bytearray()
+        for index, (cmd_name, cmd_info) in enumerate(self.commands.items()):
+            self._command_index[cmd_name] = index
+            if cmd_name in overrides:
+                self._command_funcs.append(overrides[cmd_name])
+                self._command_is_async.append(False)
+            else:
+                self._command_funcs.append(cmd_info['handler'])
+                self._command_is_async.append(cmd_info['is_async'])
+
+        # Help is rendered once per language and written in a single call
+        help_text = [('', "\n=== Chat Commands ===\nType 'help' for this help message\n\n")]
+        for handler in self._handlers:
+            help_text.extend(handler.render_commands_help())
+        help_text.append(('', "======================\n\n"))
+        self._help_text = FormattedText(help_text)
+
+    def _absorb(self, commands: dict) -> None:
+        """Add a sub-handler's commands to the combined and sync/async tables in one pass.
         
-        for cmd_name, cmd_info in self.commands.items():
+        Args:
+            commands (dict): Command metadata returned by a sub-handler.
+        """
+        commands_set = self.commands.__setitem__
+        sync_set = self.sync_commands.__setitem__
+        async_set = self.async_commands.__setitem__
+        for cmd_name, cmd_info in commands.items():
+            # Interned names let dispatch lookups compare keys by identity
+            cmd_name = sys.intern(cmd_name)
+            commands_set(cmd_name, cmd_info)
             if cmd_info['is_async']:
-                self.async_commands[cmd_name] = (cmd_info['handler'], cmd_info['description'])
+                async_set(cmd_name, cmd_info['handler'])
             else:
-                self.sync_commands[cmd_name] = (cmd_info['handler'], cmd_info['description'])
+                sync_set(cmd_name, cmd_info['handler'])
         
     def print_commands_help(self) -> None:
         """Print help for all available chat commands."""
-        print("\n=== Chat Commands ===")
-        print("Type 'help' for this help message")
-        print()
+        print_formatted_text(self._help_text, style=self.base_commands.style, end='')
+
+    def _cmd_help(self, _: str) -> bool:
+        """Print help for all available chat commands.
         
-        self.base_commands.print_commands_help()
-        self.hatch_commands.print_commands_help()
-        self.settings_commands.print_commands_help()
-        self.mcp_commands.print_commands_help()
-        self.model_commands.print_commands_help()
+        Args:
+            _ (str): Unused arguments.
             
-        print("======================\n")
+        Returns:
+            bool: True to continue the chat session.
+        """
+        self.print_commands_help()
+        return True
+
+    def _cmd_language_set(self, args: str) -> bool:
+        """Set the language for all commands.
+        
+        Args:
+            args (str): The language code to set.
+            
+        Returns:
+            bool: True to continue the chat session.
+        """
+        self.set_commands_language(args.strip())
+        return True
 
     def set_commands_language(self, language_code: str) -> None:
         """Set the language for all commands.
@@ -92,6 +216,10 @@ class ChatCommandHandler:
             self.logger.error(translate("errors.settings_registry_not_available"))
 
         try:
+            # Re-applying the current language leaves the command tables unchanged
+            if language_code == self.settings_registry.get_current_language():
+                return
+
             success = self.settings_registry.set_language(language_code)
             if success:
                 self._register_commands()  # Re-register commands to apply new language
@@ -118,34 +246,25 @@ class ChatCommandHandler:
         if not user_input:
             return True, True
             
-        # Extract command and arguments
-        parts = user_input.split(' ', 1)
-        command = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
+        # Extract command and arguments; commands are typed in lowercase most of the time
+        head, _, args = user_input.partition(' ')
+        command = head if head.islower() else head.lower()
+        if len(command) < _INTERN_MAX_LENGTH:
+            command = sys.intern(command)
 
-        if command == "help":
-            self.print_commands_help()
-            return True, True
-        
-        if command == "settings:language:set":
-            self.set_commands_language(args.strip())
-            return True, True
-        
-        # Check if the input is a registered command
-        if command in self.sync_commands:
-            handler_func, _ = self.sync_commands[command]
-            return True, handler_func(args)
-        elif command in self.async_commands:
-            async_handler_func, _ = self.async_commands[command]
-            return True, await async_handler_func(args)
-            
-        # Not a command
-        return False, True
+        index = self._command_index.get(command)
+        if index is None:
+            # Not a command
+            return False, True
+
+        handler_func = self._command_funcs[index]
+        return True, (await handler_func(args)) if self._command_is_async[index] else handler_func(args)
 
-    def get_all_command_metadata(self) -> dict:
+    def get_all_command_metadata(self) -> Mapping[str, Dict[str, Any]]:
         """Get all command metadata from both command handlers.
         
         Returns:
-            dict: Combined command metadata from base and hatch commands.
+            Mapping[str, Dict[str, Any]]: Read-only view of the combined command metadata
+                from all command handlers.
         """
-        return self.commands
\ No newline at end of file
+        return self._commands_view
\ No newline at end of file
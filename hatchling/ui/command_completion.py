@@ -6,7 +6,7 @@ It implements a three-phase approach:
 - Phase 3: Dynamic value completion (environment names, package names, file paths)
 """
 
-from typing import List, Dict, Any, Optional, Iterable
+from typing import List, Dict, Any, Mapping, Optional, Iterable
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.completion.filesystem import PathCompleter
 from prompt_toolkit.document import Document
@@ -14,18 +14,22 @@ from pathlib import Path
 
 from hatch import HatchEnvironmentManager
 from hatchling.config.i18n import get_available_languages
+from hatchling.ui.command_trie import CommandTrie
 
 class CommandCompleter(Completer):
     """Main completer class that provides autocompletion for chat commands."""
     
-    def __init__(self, commands: Dict[str, Dict[str, Any]], env_manager: HatchEnvironmentManager):
+    def __init__(self, commands: Mapping[str, Dict[str, Any]], env_manager: HatchEnvironmentManager,
+                 command_trie: Optional[CommandTrie] = None):
         """Initialize the command completer.
         
         Args:
             commands: Dictionary containing command metadata from ChatCommandHandler
             env_manager: Hatch environment manager for dynamic completion
+            command_trie: Prefix tree over the same commands, built from them if not provided
         """
         self.commands = commands
+        self.command_trie = command_trie if command_trie is not None else CommandTrie(commands.items())
         self.env_manager = env_manager
         self.path_completer = PathCompleter()
         
@@ -62,20 +66,21 @@ class CommandCompleter(Completer):
         # If we have a command, complete its arguments
         if len(parts) >= 1:
             command = parts[0].lower()
-            if command in self.commands:
+            if command in self.command_trie:
                 yield from self._get_argument_completions(command, parts[1:], text)
                 return
                 
         # Fallback - no completions available
         return []
     
-    def set_commands(self, commands: Dict[str, Dict[str, Any]]):
+    def set_commands(self, commands: Mapping[str, Dict[str, Any]]):
         """Set the command metadata for this completer.
         
         Args:
             commands: Dictionary containing command metadata
         """
         self.commands = commands
+        self.command_trie = CommandTrie(commands.items())
 
     def _get_command_completions(self, prefix: str) -> Iterable[Completion]:
         """Get completions for command names.
@@ -86,17 +91,17 @@ class CommandCompleter(Completer):
         Yields:
             Completion: Command completions
         """
-        for cmd_name, cmd_info in self.commands.items():
-            if cmd_name.lower().startswith(prefix.lower()):
-                # Calculate the start position for replacement
-                start_position = -len(prefix) if prefix else 0
-                
-                yield Completion(
-                    text=cmd_name,
-                    start_position=start_position,
-                    display=cmd_name,
-                    display_meta=cmd_info.get('description', '')
-                )
+        # Calculate the start position for replacement
+        start_position = -len(prefix) if prefix else 0
+        
+        # Command names are lowercase, so only the matching subtree is visited
+        for cmd_name, cmd_info in self.command_trie.items(prefix.lower()):
+            yield Completion(
+                text=cmd_name,
+                start_position=start_position,
+                display=cmd_name,
+                display_meta=cmd_info.get('description', '')
+            )
                 
     def _get_argument_completions(self, command: str, args: List[str], full_text: str) -> Iterable[Completion]:
         """Get completions for command arguments.
@@ -4,26 +4,44 @@ This module provides a custom lexer that highlights commands, arguments, and val
 as the user types them in the chat interface.
 """
 
-from typing import List, Tuple, Dict, Any
+import re
+from typing import Iterable, List, Mapping, Pattern, Tuple, Dict, Any, Optional
 
 from prompt_toolkit.lexers import Lexer
 from prompt_toolkit.document import Document
 
 
+def compile_command_pattern(command_names: Iterable[str]) -> Pattern:
+    """Compile a pattern matching a known command at the start of a line.
+    
+    Args:
+        command_names: The command names to match.
+        
+    Returns:
+        Compiled pattern whose first group is the command name.
+    """
+    # Longest names first so that no command is shadowed by one of its prefixes
+    alternation = "|".join(re.escape(name) for name in sorted(command_names, key=len, reverse=True))
+    return re.compile(rf"({alternation})(?=\s|$)")
+
+
+
 class ChatCommandLexer(Lexer):
     """Custom lexer for highlighting chat commands in real-time."""
     
-    def __init__(self, commands: Dict[str, Dict[str, Any]]):
+    def __init__(self, commands: Mapping[str, Dict[str, Any]], command_pattern: Optional[Pattern] = None):
         """Initialize the lexer with command metadata.
         
         Args:
             commands: Dictionary containing command information including
                             command names, arguments, and their types.
+            command_pattern: Pattern from compile_command_pattern() over the same commands,
+                            compiled from them if not provided.
         """
         self.commands = commands
         
         # Build command patterns
-        self.command_names = set(commands.keys())
+        self.command_pattern = command_pattern if command_pattern is not None else compile_command_pattern(commands)
         
         # Build argument patterns for each command
         self.command_args = {}
@@ -74,31 +92,21 @@ class ChatCommandLexer(Lexer):
         Returns:
             List of (token_type, token_text) tuples.
         """
-        tokens = []
-        
-        # Simple tokenization - split by spaces but respect quotes
-        parts = self._split_respecting_quotes(text)
-        
-        if not parts:
+        # The first part should be a valid command; anything else is regular text,
+        # which is recognized without splitting the whole line
+        match = self.command_pattern.match(text)
+        if match is None:
             return [('text', text)]
-        
-        # First part should be the command
-        command = parts[0]
-        
-        # Check if it's a valid command
-        if command in self.command_names:
-            # Get command group for styling
-            cmd_info = self.commands[command]
-            group = 'hatch' if command.startswith('hatch:') else 'base'
 
-            tokens.append((f'command.{group}', command))
+        command = match.group(1)
+        # Get command group for styling
+        group = 'hatch' if command.startswith('hatch:') else 'base'
+        tokens = [(f'command.{group}', command)]
 
-            # Process arguments
-            if len(parts) > 1:
-                tokens.extend(self._tokenize_arguments(command, parts[1:], group))
-        else:
-            # Not a command, treat as regular text
-            tokens.append(('text', text))
+        # Simple tokenization of the arguments - split by spaces but respect quotes
+        arg_parts = self._split_respecting_quotes(text[match.end():])
+        if arg_parts:
+            tokens.extend(self._tokenize_arguments(command, arg_parts, group))
         
         return tokens
     
@@ -0,0 +1,112 @@
+"""Prefix tree over command names for the chat interface.
+
+This module provides the CommandTrie class, a small character trie used by the
+command completer to answer command lookups and prefix queries. Commands are
+reported in the order they were registered, like the command table itself.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+# Key under which a node stores the (sequence number, value) of the command ending
+# at that node. Command names are strings, so a non-string key can never collide
+# with a child.
+_VALUE = None
+
+
+class CommandTrie:
+    """Character trie mapping command names to their metadata."""
+
+    def __init__(self, commands: Optional[Iterable[Tuple[str, Any]]] = None):
+        """Initialize the trie.
+
+        Args:
+            commands (Optional[Iterable[Tuple[str, Any]]]): (name, value) pairs to insert.
+        """
+        self._root: Dict[Any, Any] = {}
+        self._size = 0
+        self._next_seq = 0
+
+        if commands is not None:
+            for name, value in commands:
+                self.insert(name, value)
+
+    def insert(self, name: str, value: Any) -> None:
+        """Insert or replace a command.
+
+        A replaced command keeps its original position in the iteration order.
+
+        Args:
+            name (str): The command name.
+            value (Any): The value associated with the command.
+        """
+        node = self._root
+        for char in name:
+            node = node.setdefault(char, {})
+        if _VALUE in node:
+            node[_VALUE] = (node[_VALUE][0], value)
+        else:
+            node[_VALUE] = (self._next_seq, value)
+            self._next_seq += 1
+            self._size += 1
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get the value of a command.
+
+        The walk stops at the first character without a matching child, so inputs
+        that are not commands are usually rejected after a few characters.
+
+        Args:
+            name (str): The command name.
+            default (Any): Value returned if the command is unknown.
+
+        Returns:
+            Any: The command's value, or default.
+        """
+        node = self._root
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                return default
+        entry = node.get(_VALUE)
+        return default if entry is None else entry[1]
+
+    def __contains__(self, name: str) -> bool:
+        node = self._root
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _VALUE in node
+
+    def __len__(self) -> int:
+        return self._size
+
+    def items(self, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+        """Iterate over the commands starting with a prefix.
+
+        Args:
+            prefix (str): The prefix to match. Defaults to "" (all commands).
+
+        Yields:
+            Tuple[str, Any]: (name, value) pairs, in insertion order.
+        """
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return
+
+        matches = []
+        stack = [(prefix, node)]
+        while stack:
+            name, node = stack.pop()
+            for char, child in node.items():
+                if char is _VALUE:
+                    matches.append((child[0], name, child[1]))
+                else:
+                    stack.append((name + char, child))
+
+        # Walking the tree groups commands by shared prefixes; restore registration order
+        matches.sort(key=lambda match: match[0])
+        for _, name, value in matches:
+            yield name, value
@@ -4,403 +4,530 @@ This module provides commands for interacting with the Hatch package manager,
 including environment management, package operations, and template creation.
 """
 
+import functools
+import inspect
+import time
 from typing import Dict, Any
 from pathlib import Path
+from types import MappingProxyType
 
 from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
 
-# Import Hatch components - assumes Hatch is installed or available in the Python path
-# from hatch import HatchEnvironmentManager
-from hatch import create_package_template
-
 from hatchling.config.i18n import translate
-from hatchling.mcp_utils.manager import mcp_manager
-from hatchling.ui.abstract_commands import AbstractCommands
+from hatchling.ui.abstract_commands import AbstractCommands, COMMAND_NAME_STYLES, compile_arg_defs, translate_arg_schema
 
-class HatchCommands(AbstractCommands):
-    """Handles Hatch package manager commands in the chat interface."""
+# Seconds a cached Python environment info entry stays valid. The environments
+# can also be changed outside of the chat, so entries are not kept indefinitely.
+_PYTHON_INFO_TTL = 30.0
 
-    def _register_commands(self) -> None:
-        """Register all available Hatch package manager commands."""
-        
-        self.commands = {
-            # Environment commands
-            'hatch:env:list': {
-                'handler': self._cmd_env_list,
-                'description': translate('commands.hatch.env_list_description'),
-                'is_async': False,
-                'args': {}
+# Static command schema. Handlers are given by method name and descriptions by
+# translation key; both are resolved per instance in `_register_commands`.
+_COMMAND_SCHEMA = {
+    # Environment commands
+    'hatch:env:list': {
+        'handler': '_cmd_env_list',
+        'description_key': 'commands.hatch.env_list_description',
+        'is_async': False,
+        'args': {}
+    },
+    'hatch:env:create': {
+        'handler': '_cmd_env_create',
+        'description_key': 'commands.hatch.env_create_description',
+        'is_async': False,
+        'args': {
+            'name': {
+                'positional': True,
+                'completer_type': 'none',
+                'description_key': 'commands.args.env_name_description',
+                'required': True
             },
-            'hatch:env:create': {
-                'handler': self._cmd_env_create,
-                'description': translate('commands.hatch.env_create_description'),
-                'is_async': False,
-                'args': {
-                    'name': {
-                        'positional': True,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.env_name_description'),
-                        'required': True
-                    },
-                    'description': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.env_description_description'),
-                        'aliases': ['D'],
-                        'default': '',
-                        'required': False
-                    },
-                    'python-version': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.python_version_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'no-python': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.no_python_description'),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'no-hatch-mcp-server': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.no_hatch_mcp_server_description'),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'hatch_mcp_server_tag': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.hatch_mcp_server_tag_description'),
-                        'default': None,
-                        'required': False
-                    }
-                }
+            'description': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.env_description_description',
+                'aliases': ['D'],
+                'default': '',
+                'required': False
             },
-            'hatch:env:remove': {
-                'handler': self._cmd_env_remove,
-                'description': translate('commands.hatch.env_remove_description'),
-                'is_async': False,
-                'args': {
-                    'name': {
-                        'positional': True,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.env_remove_name_description'),
-                        'required': True
-                    }
-                }
+            'python-version': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.python_version_description',
+                'default': None,
+                'required': False
             },
-            'hatch:env:current': {
-                'handler': self._cmd_env_current,
-                'description': translate('commands.hatch.env_current_description'),
-                'is_async': False,
-                'args': {}
+            'no-python': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.no_python_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            'hatch:env:use': {
-                'handler': self._cmd_env_use,
-                'description': translate('commands.hatch.env_use_description'),
-                'is_async': True,
-                'args': {
-                    'name': {
-                        'positional': True,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.env_use_name_description'),
-                        'required': True
-                    }
-                }
+            'no-hatch-mcp-server': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.no_hatch_mcp_server_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            # Package commands
-            'hatch:pkg:add': {
-                'handler': self._cmd_pkg_add,
-                'description': translate('commands.hatch.pkg_add_description'),
-                'is_async': False,
-                'args': {
-                    'package_path_or_name': {
-                        'positional': True,
-                        'completer_type': 'local_package',
-                        'description': translate('commands.args.package_path_or_name_description'),
-                        'required': True
-                    },
-                    'env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.env_target_description'),
-                        'aliases': ['e'],
-                        'default': None,
-                        'required': False
-                    },
-                    'version': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.package_version_description'),
-                        'aliases': ['v'],
-                        'default': None,
-                        'required': False
-                    },
-                    'force-download': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.force_download_description'),
-                        'aliases': ['f'],
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'refresh-registry': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.refresh_registry_description'),
-                        'aliases': ['r'],
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'auto-approve': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.auto_approve_description'),
-                        'aliases': ['y'],
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
-                }
+            'hatch_mcp_server_tag': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.hatch_mcp_server_tag_description',
+                'default': None,
+                'required': False
+            }
+        }
+    },
+    'hatch:env:remove': {
+        'handler': '_cmd_env_remove',
+        'description_key': 'commands.hatch.env_remove_description',
+        'is_async': False,
+        'args': {
+            'name': {
+                'positional': True,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.env_remove_name_description',
+                'required': True
+            }
+        }
+    },
+    'hatch:env:current': {
+        'handler': '_cmd_env_current',
+        'description_key': 'commands.hatch.env_current_description',
+        'is_async': False,
+        'args': {}
+    },
+    'hatch:env:use': {
+        'handler': '_cmd_env_use',
+        'description_key': 'commands.hatch.env_use_description',
+        'is_async': True,
+        'args': {
+            'name': {
+                'positional': True,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.env_use_name_description',
+                'required': True
+            }
+        }
+    },
+    # Package commands
+    'hatch:pkg:add': {
+        'handler': '_cmd_pkg_add',
+        'description_key': 'commands.hatch.pkg_add_description',
+        'is_async': False,
+        'args': {
+            'package_path_or_name': {
+                'positional': True,
+                'completer_type': 'local_package',
+                'description_key': 'commands.args.package_path_or_name_description',
+                'required': True
             },
-            'hatch:pkg:remove': {
-                'handler': self._cmd_pkg_remove,
-                'description': translate('commands.hatch.pkg_remove_description'),
-                'is_async': False,
-                'args': {
-                    'package_name': {
-                        'positional': True,
-                        'completer_type': 'package',
-                        'description': translate('commands.args.package_name_description'),
-                        'required': True
-                    },
-                    'env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.env_remove_package_description'),
-                        'aliases': ['e'],
-                        'default': None,
-                        'required': False
-                    }
-                }
+            'env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.env_target_description',
+                'aliases': ['e'],
+                'default': None,
+                'required': False
             },
-            'hatch:pkg:list': {
-                'handler': self._cmd_pkg_list,
-                'description': translate('commands.hatch.pkg_list_description'),
-                'is_async': False,
-                'args': {
-                    'env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.env_list_packages_description'),
-                        'aliases': ['e'],
-                        'default': None,
-                        'required': False
-                    }
-                }
+            'version': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.package_version_description',
+                'aliases': ['v'],
+                'default': None,
+                'required': False
             },
-            # Package creation command
-            'hatch:pkg:create': {
-                'handler': self._cmd_create_package,
-                'description': translate('commands.hatch.pkg_create_description'),
-                'is_async': False,
-                'args': {
-                    'name': {
-                        'positional': True,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.package_create_name_description'),
-                        'required': True
-                    },
-                    'dir': {
-                        'positional': False,
-                        'completer_type': 'path',
-                        'description': translate('commands.args.dir_description'),
-                        'aliases': ['d'],
-                        'default': '.',
-                        'required': False
-                    },
-                    'description': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.package_description_description'),
-                        'aliases': ['D'],
-                        'default': '',
-                        'required': False
-                    }
-                }
+            'force-download': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.force_download_description',
+                'aliases': ['f'],
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            # Package validation command
-            'hatch:pkg:validate': {
-                'handler': self._cmd_validate_package,
-                'description': translate('commands.hatch.pkg_validate_description'),
-                'is_async': False,
-                'args': {
-                    'package_dir': {
-                        'positional': True,
-                        'completer_type': 'path',
-                        'description': translate('commands.args.package_dir_description'),
-                        'required': True
-                    }
-                }
+            'refresh-registry': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.refresh_registry_description',
+                'aliases': ['r'],
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            # Python environment management commands
-            'hatch:env:python:init': {
-                'handler': self._cmd_env_python_init,
-                'description': translate('commands.hatch.env_python_init_description'),
-                'is_async': False,
-                'args': {
-                    'hatch_env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.hatch_env_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'python-version': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.python_version_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'force': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.force_recreation_description'),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'no-hatch-mcp-server': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.no_hatch_mcp_server_wrapper_description'),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'hatch_mcp_server_tag': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.hatch_mcp_server_tag_description'),
-                        'default': None,
-                        'required': False
-                    }
-                }
+            'auto-approve': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.auto_approve_description',
+                'aliases': ['y'],
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'hatch:pkg:remove': {
+        'handler': '_cmd_pkg_remove',
+        'description_key': 'commands.hatch.pkg_remove_description',
+        'is_async': False,
+        'args': {
+            'package_name': {
+                'positional': True,
+                'completer_type': 'package',
+                'description_key': 'commands.args.package_name_description',
+                'required': True
             },
-            'hatch:env:python:info': {
-                'handler': self._cmd_env_python_info,
-                'description': translate('commands.hatch.env_python_info_description'),
-                'is_async': False,
-                'args': {
-                    'hatch_env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.hatch_env_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'detailed': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.detailed_description'),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
-                }
+            'env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.env_remove_package_description',
+                'aliases': ['e'],
+                'default': None,
+                'required': False
+            }
+        }
+    },
+    'hatch:pkg:list': {
+        'handler': '_cmd_pkg_list',
+        'description_key': 'commands.hatch.pkg_list_description',
+        'is_async': False,
+        'args': {
+            'env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.env_list_packages_description',
+                'aliases': ['e'],
+                'default': None,
+                'required': False
+            }
+        }
+    },
+    # Package creation command
+    'hatch:pkg:create': {
+        'handler': '_cmd_create_package',
+        'description_key': 'commands.hatch.pkg_create_description',
+        'is_async': False,
+        'args': {
+            'name': {
+                'positional': True,
+                'completer_type': 'none',
+                'description_key': 'commands.args.package_create_name_description',
+                'required': True
             },
-            'hatch:env:python:remove': {
-                'handler': self._cmd_env_python_remove,
-                'description': translate('commands.hatch.env_python_remove_description'),
-                'is_async': False,
-                'args': {
-                    'hatch_env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.hatch_env_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'force': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.force_removal_description'),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
-                }
+            'dir': {
+                'positional': False,
+                'completer_type': 'path',
+                'description_key': 'commands.args.dir_description',
+                'aliases': ['d'],
+                'default': '.',
+                'required': False
             },
-            'hatch:env:python:shell': {
-                'handler': self._cmd_env_python_shell,
-                'description': translate('commands.hatch.env_python_shell_description'),
-                'is_async': False,
-                'args': {
-                    'hatch_env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.hatch_env_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'cmd': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.cmd_description'),
-                        'default': None,
-                        'required': False
-                    }
-                }
+            'description': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.package_description_description',
+                'aliases': ['D'],
+                'default': '',
+                'required': False
+            }
+        }
+    },
+    # Package validation command
+    'hatch:pkg:validate': {
+        'handler': '_cmd_validate_package',
+        'description_key': 'commands.hatch.pkg_validate_description',
+        'is_async': False,
+        'args': {
+            'package_dir': {
+                'positional': True,
+                'completer_type': 'path',
+                'description_key': 'commands.args.package_dir_description',
+                'required': True
+            }
+        }
+    },
+    # Python environment management commands
+    'hatch:env:python:init': {
+        'handler': '_cmd_env_python_init',
+        'description_key': 'commands.hatch.env_python_init_description',
+        'is_async': False,
+        'args': {
+            'hatch_env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.hatch_env_description',
+                'default': None,
+                'required': False
+            },
+            'python-version': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.python_version_description',
+                'default': None,
+                'required': False
+            },
+            'force': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.force_recreation_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            },
+            'no-hatch-mcp-server': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.no_hatch_mcp_server_wrapper_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            },
+            'hatch_mcp_server_tag': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.hatch_mcp_server_tag_description',
+                'default': None,
+                'required': False
+            }
+        }
+    },
+    'hatch:env:python:info': {
+        'handler': '_cmd_env_python_info',
+        'description_key': 'commands.hatch.env_python_info_description',
+        'is_async': False,
+        'args': {
+            'hatch_env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.hatch_env_description',
+                'default': None,
+                'required': False
             },
-            'hatch:env:python:add-hatch-mcp': {
-                'handler': self._cmd_env_python_add_hatch_mcp,
-                'description': translate('commands.hatch.env_python_add_hatch_mcp_description'),
-                'is_async': False,
+            'detailed': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.detailed_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'hatch:env:python:remove': {
+        'handler': '_cmd_env_python_remove',
+        'description_key': 'commands.hatch.env_python_remove_description',
+        'is_async': False,
+        'args': {
+            'hatch_env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.hatch_env_description',
+                'default': None,
+                'required': False
+            },
+            'force': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.force_removal_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'hatch:env:python:shell': {
+        'handler': '_cmd_env_python_shell',
+        'description_key': 'commands.hatch.env_python_shell_description',
+        'is_async': False,
+        'args': {
+            'hatch_env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.hatch_env_description',
+                'default': None,
+                'required': False
+            },
+            'cmd': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.cmd_description',
+                'default': None,
+                'required': False
+            }
+        }
+    },
+    'hatch:env:python:add-hatch-mcp': {
+        'handler': '_cmd_env_python_add_hatch_mcp',
+        'description_key': 'commands.hatch.env_python_add_hatch_mcp_description',
+        'is_async': False,
+        'args': {
+            'hatch_env': {
+                'positional': False,
+                'completer_type': 'environment',
+                'description_key': 'commands.args.hatch_env_special_description',
+                'default': None,
+                'required': False
+            },
+            'tag': {
+                'positional': False,
+                'completer_type': 'none',
+                'description_key': 'commands.args.tag_description',
+                'default': None,
+                'required': False
+            }
+        }
+    }
+}
+
+# Argument definitions of each command, to parse its arguments with (read-only)
+_ARG_DEFS = MappingProxyType({
+    cmd_name: compile_arg_defs(cmd_schema['args'])
+    for cmd_name, cmd_schema in _COMMAND_SCHEMA.items()
+})
+
+
+def _maybe_resolve(path: str) -> Path:
+    """Get an absolute path, resolving it only when needed.
+    
+    Absolute paths without '..' components are returned as given, which skips the
+    filesystem lookups done by `Path.resolve`.
+    
+    Args:
+        path (str): The path given on the command line.
+        
+    Returns:
+        Path: The absolute path.
+    """
+    candidate = Path(path)
+    if candidate.is_absolute() and '..' not in candidate.parts:
+        return candidate
+    return candidate.resolve()
+
+
+def _command_handler(action: str):
+    """Decorate a command handler so that its errors are logged instead of raised.
+    
+    Args:
+        action (str): What the command does, used in error messages
+                      (e.g. "listing environments").
+        
+    Returns:
+        Callable: Decorator for sync and async command handlers, which return True
+                  to continue the chat session after an error.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, args: str) -> bool:
+                try:
+                    return await func(self, args)
+                except Exception as e:
+                    self.logger.error(f"Error {action}: {e}")
+                    return True
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, args: str) -> bool:
+            try:
+                return func(self, args)
+            except Exception as e:
+                self.logger.error(f"Error {action}: {e}")
+                return True
+        return wrapper
+    return decorator
+
+
+class HatchCommands(AbstractCommands):
+    """Handles Hatch package manager commands in the chat interface."""
+
+    __slots__ = ("_python_info_cache",)
+
+    def __init__(self, chat_session, settings_registry, style=None):
+        """Initialize the Hatch command handler.
+
+        Args:
+            chat_session: The chat session this handler is associated with.
+            settings_registry (SettingsRegistry): The settings registry.
+            style (Optional[Style]): Style for formatting command output.
+        """
+        # Python environment info by Hatch environment name, as (timestamp, info)
+        self._python_info_cache: Dict[Any, tuple] = {}
+        super().__init__(chat_session, settings_registry, style)
+
+    def _register_commands(self) -> None:
+        """Register all available Hatch package manager commands."""
+        self.commands = {
+            cmd_name: {
+                'handler': getattr(self, cmd_schema['handler']),
+                'description': translate(cmd_schema['description_key']),
+                'is_async': cmd_schema['is_async'],
                 'args': {
-                    'hatch_env': {
-                        'positional': False,
-                        'completer_type': 'environment',
-                        'description': translate('commands.args.hatch_env_special_description'),
-                        'default': None,
-                        'required': False
-                    },
-                    'tag': {
-                        'positional': False,
-                        'completer_type': 'none',
-                        'description': translate('commands.args.tag_description'),
-                        'default': None,
-                        'required': False
-                    }
+                    arg_name: translate_arg_schema(arg_schema)
+                    for arg_name, arg_schema in cmd_schema['args'].items()
                 }
             }
+            for cmd_name, cmd_schema in _COMMAND_SCHEMA.items()
         }
     
-    def print_commands_help(self) -> None:
-        """Print help for all available chat commands."""
-        print_formatted_text(FormattedText([
-            ('class:header', "\n=== Hatch Chat Commands ===\n")
-        ]), style=self.style)
-        
-        super().print_commands_help()
+    @property
+    def env_manager(self):
+        """Hatch environment manager, imported with the MCP manager on first use."""
+        from hatchling.mcp_utils.manager import mcp_manager
+        return mcp_manager.hatch_env_manager
 
-    def format_command(self, cmd_name: str, cmd_info: Dict[str, Any], group: str = 'hatch') -> list:
-        """Format Hatch commands with custom styling."""
+    @staticmethod
+    def _resolve_env_name(hatch_env) -> str:
+        """Get the display name of a Hatch environment argument.
+
+        Args:
+            hatch_env (Optional[str]): Hatch environment name, None for the current one.
+
+        Returns:
+            str: The environment name, or "current environment".
+        """
+        return hatch_env or "current environment"
+
+    def _get_python_environment_info(self, hatch_env):
+        """Get Python environment info, reusing a recent result for the same environment.
+
+        Querying the environment runs conda/mamba, so results are cached for
+        _PYTHON_INFO_TTL seconds. Commands that change environments clear the cache.
+
+        Args:
+            hatch_env (Optional[str]): Hatch environment name, None for the current one.
+
+        Returns:
+            Optional[Dict[str, Any]]: The Python environment info.
+        """
+        now = time.monotonic()
+        entry = self._python_info_cache.get(hatch_env)
+        if entry is not None and now - entry[0] < _PYTHON_INFO_TTL:
+            return entry[1]
+        info = self.env_manager.get_python_environment_info(hatch_env)
+        self._python_info_cache[hatch_env] = (now, info)
+        return info
+
+    def render_commands_help(self) -> list:
+        """Render help for all available chat commands, preceded by a header."""
         return [
-            (f'class:command.name.{group}', f"{cmd_name}"),
+            ('class:header', "\n=== Hatch Chat Commands ===\n"),
+            ('', '\n')
+        ] + super().render_commands_help()
+
+    def format_command(self, cmd_name: str, cmd_info: Dict[str, Any], group: str = 'hatch') -> tuple:
+        """Format Hatch commands with custom styling."""
+        return (
+            (COMMAND_NAME_STYLES.get(group) or f'class:command.name.{group}', cmd_name),
             ('', ' - '),
-            ('class:command.description', f"{cmd_info['description']}")
-        ]
+            ('class:command.description', cmd_info['description'])
+        )
     
+    @_command_handler("listing environments")
     def _cmd_env_list(self, _: str) -> bool:
         """List all available Hatch environments.
         
@@ -410,24 +537,24 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        try:
-            environments = mcp_manager.hatch_env_manager.list_environments()
-            
-            if not environments:
-                print("No Hatch environments found.")
-                return True
-            
-            print("Available Hatch environments:")
-            for env in environments:
-                current_marker = "* " if env.get("is_current") else "  "
-                description = f" - {env.get('description')}" if env.get("description") else ""
-                print(f"{current_marker}{env.get('name')}{description}")
-                
-        except Exception as e:
-            self.logger.error(f"Error listing environments: {e}")
-            
+        environments = self.env_manager.list_environments()
+        
+        if not environments:
+            print("No Hatch environments found.")
+            return True
+        
+        lines = ["Available Hatch environments:"]
+        for env in environments:
+            name, description, is_current = env.get("name"), env.get("description"), env.get("is_current")
+            current_marker = "* " if is_current else "  "
+            description = f" - {description}" if description else ""
+            lines.append(f"{current_marker}{name}{description}")
+        # Write the whole listing at once
+        print_formatted_text(FormattedText([('', "\n".join(lines))]), style=self.style)
+        
         return True
     
+    @_command_handler("creating environment")
     def _cmd_env_create(self, args: str) -> bool:
         """Create a new Hatch environment.
         
@@ -446,64 +573,55 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'name': {'positional': True},
-            'description': {'aliases': ['D'], 'default': ''},
-            'python-version': {'default': None},
-            'no-python': {'default': False, 'action': 'store_true'},
-            'no-hatch-mcp-server': {'default': False, 'action': 'store_true'},
-            'hatch_mcp_server_tag': {'default': None}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:create'])
 
-        if 'name' not in parsed_args or not parsed_args['name']:
+        name = parsed_args.get('name')
+        if not name:
             self.logger.error("Environment name is required.")
             self._print_command_help('hatch:env:create')
             return True
         
-        try:
-            name = parsed_args['name']
-            description = parsed_args.get('description', '')
-            python_version = parsed_args.get('python-version')
-            create_python_env = not parsed_args.get('no-python', False)
-            no_hatch_mcp_server = parsed_args.get('no-hatch-mcp-server', False)
-            hatch_mcp_server_tag = parsed_args.get('hatch_mcp_server_tag')
-            
-            if mcp_manager.hatch_env_manager.create_environment(
-                name, 
-                description, 
-                python_version=python_version, 
-                create_python_env=create_python_env,
-                no_hatch_mcp_server=no_hatch_mcp_server,
-                hatch_mcp_server_tag=hatch_mcp_server_tag
-            ):                
-                self.logger.info(f"Environment created: {name}")
-                if create_python_env and python_version:
-                    self.logger.info(f"Python environment initialized with version: {python_version}")
-                elif create_python_env:
-                    self.logger.info("Python environment initialized with default version")
-                else:
-                    self.logger.info("Python environment creation skipped (--no-python)")
-                
-                # Provide feedback about MCP server installation
-                if create_python_env and not no_hatch_mcp_server:
-                    if hatch_mcp_server_tag:
-                        self.logger.info(f"hatch_mcp_server installed with tag/branch: {hatch_mcp_server_tag}")
-                    else:
-                        self.logger.info("hatch_mcp_server installed with default branch")
-                elif no_hatch_mcp_server:
-                    self.logger.info("hatch_mcp_server installation skipped (--no-hatch-mcp-server)")
-                elif not create_python_env:
-                    self.logger.info("hatch_mcp_server installation skipped (no Python environment)")
+        description = parsed_args.get('description', '')
+        python_version = parsed_args.get('python-version')
+        create_python_env = not parsed_args.get('no-python', False)
+        no_hatch_mcp_server = parsed_args.get('no-hatch-mcp-server', False)
+        hatch_mcp_server_tag = parsed_args.get('hatch_mcp_server_tag')
+        
+        self._python_info_cache.clear()
+        if self.env_manager.create_environment(
+            name, 
+            description, 
+            python_version=python_version, 
+            create_python_env=create_python_env,
+            no_hatch_mcp_server=no_hatch_mcp_server,
+            hatch_mcp_server_tag=hatch_mcp_server_tag
+        ):
+            # Report the outcome as a single log entry
+            messages = [f"Environment created: {name}"]
+            if create_python_env and python_version:
+                messages.append(f"Python environment initialized with version: {python_version}")
+            elif create_python_env:
+                messages.append("Python environment initialized with default version")
             else:
-                self.logger.error(f"Failed to create environment: {name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error creating environment: {e}")
+                messages.append("Python environment creation skipped (--no-python)")
             
+            # Provide feedback about MCP server installation
+            if create_python_env and not no_hatch_mcp_server:
+                if hatch_mcp_server_tag:
+                    messages.append(f"hatch_mcp_server installed with tag/branch: {hatch_mcp_server_tag}")
+                else:
+                    messages.append("hatch_mcp_server installed with default branch")
+            elif no_hatch_mcp_server:
+                messages.append("hatch_mcp_server installation skipped (--no-hatch-mcp-server)")
+            elif not create_python_env:
+                messages.append("hatch_mcp_server installation skipped (no Python environment)")
+            self.logger.info("\n".join(messages))
+        else:
+            self.logger.error(f"Failed to create environment: {name}")
+        
         return True
     
+    @_command_handler("removing environment")
     def _cmd_env_remove(self, args: str) -> bool:
         """Remove a Hatch environment.
         
@@ -513,30 +631,23 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'name': {'positional': True}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:remove'])
 
-        if 'name' not in parsed_args or not parsed_args['name']:
+        name = parsed_args.get('name')
+        if not name:
             self.logger.error("Environment name is required.")
             self._print_command_help('hatch:env:remove')
             return True
         
-        try:
-            name = parsed_args['name']
-
-            if mcp_manager.hatch_env_manager.remove_environment(name):
-                self.logger.info(f"Environment removed: {name}")
-            else:
-                self.logger.error(f"Failed to remove environment: {name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error removing environment: {e}")
-            
+        self._python_info_cache.clear()
+        if self.env_manager.remove_environment(name):
+            self.logger.info(f"Environment removed: {name}")
+        else:
+            self.logger.error(f"Failed to remove environment: {name}")
+        
         return True
     
+    @_command_handler("getting current environment")
     def _cmd_env_current(self, _: str) -> bool:
         """Show the current Hatch environment.
         
@@ -546,18 +657,15 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        try:
-            current_env = mcp_manager.hatch_env_manager.get_current_environment()
-            if current_env:
-                self.logger.info(f"Current environment: {current_env}")
-            else:
-                self.logger.info("No current environment set.")
-                
-        except Exception as e:
-            self.logger.error(f"Error getting current environment: {e}")
-            
+        current_env = self.env_manager.get_current_environment()
+        if current_env:
+            self.logger.info(f"Current environment: {current_env}")
+        else:
+            self.logger.info("No current environment set.")
+        
         return True
     
+    @_command_handler("setting current environment")
     async def _cmd_env_use(self, args: str) -> bool:
         """Set the current Hatch environment.
         
@@ -567,50 +675,46 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'name': {'positional': True}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
-        if 'name' not in parsed_args or not parsed_args['name']:
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:use'])
+        name = parsed_args.get('name')
+        if not name:
             self.logger.error(f"Environment name is required.")
             self._print_command_help('hatch:env:use')
             return True
         
-        try:
-            name = parsed_args['name']
+        from hatchling.mcp_utils.manager import mcp_manager
 
-            if mcp_manager.hatch_env_manager.set_current_environment(name):
-                self.logger.info(f"Current environment set to: {name}")
+        # Cached info for the current environment refers to the previous one
+        self._python_info_cache.clear()
+        if mcp_manager.hatch_env_manager.set_current_environment(name):
+            self.logger.info(f"Current environment set to: {name}")
 
-                # When changing the current environment, we must handle
-                # disconnecting from the previous environment's tools if any,
-                # and connecting to the new environment's tools.
-                if mcp_manager.is_connected:
-                    
-                    # Disconnection
-                    await mcp_manager.disconnect_all()
-                    self.logger.info("Disconnected from previous environment's tools.")
+            # When changing the current environment, we must handle
+            # disconnecting from the previous environment's tools if any,
+            # and connecting to the new environment's tools.
+            if mcp_manager.is_connected:
+                
+                # Disconnection
+                await mcp_manager.disconnect_all()
+                self.logger.info("Disconnected from previous environment's tools.")
 
-                    # Get the new environment's entry points for the MCP servers
-                    mcp_servers_url = mcp_manager.hatch_env_manager.get_servers_entry_points(name)
+                # Get the new environment's entry points for the MCP servers
+                mcp_servers_url = mcp_manager.hatch_env_manager.get_servers_entry_points(name)
 
-                    if mcp_servers_url:
-                        # Reconnect to the new environment's tools
-                        connected = await mcp_manager.connect_to_servers(mcp_servers_url)
-                        if not connected:
-                            self.logger.error("Failed to connect to new environment's MCP servers. Tools not enabled.")
-                        else:
-                            self.logger.info("Connected to new environment's MCP servers successfully!")
+                if mcp_servers_url:
+                    # Reconnect to the new environment's tools
+                    connected = await mcp_manager.connect_to_servers(mcp_servers_url)
+                    if not connected:
+                        self.logger.error("Failed to connect to new environment's MCP servers. Tools not enabled.")
+                    else:
+                        self.logger.info("Connected to new environment's MCP servers successfully!")
 
-            else:
-                self.logger.error(f"Failed to set environment: {name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error setting current environment: {e}")
-            
+        else:
+            self.logger.error(f"Failed to set environment: {name}")
+        
         return True
     
+    @_command_handler("adding package")
     def _cmd_pkg_add(self, args: str) -> bool:
         """Add a package to an environment.
         
@@ -620,39 +724,28 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'package_path_or_name': {'positional': True},
-            'env': {'aliases': ['e'], 'default': None},
-            'version': {'aliases': ['v'], 'default': None},
-            'force-download': {'aliases': ['f'], 'default': False, 'action': 'store_true'},
-            'refresh-registry': {'aliases': ['r'], 'default': False, 'action': 'store_true'},
-            'auto-approve': {'aliases': ['y'], 'default': False, 'action': 'store_true'}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
-        if 'package_path_or_name' not in parsed_args or not parsed_args['package_path_or_name']:
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:pkg:add'])
+        package = parsed_args.get('package_path_or_name')
+        if not package:
             self.logger.error("Package path or name is required.")
             self._print_command_help('hatch:pkg:add')
             return True
         
-        try:
-            package = parsed_args['package_path_or_name']
-            env = parsed_args.get('env')
-            version = parsed_args.get('version')
-            force_download = parsed_args.get('force-download', False)
-            refresh_registry = parsed_args.get('refresh-registry', False)
-            auto_approve = parsed_args.get('auto-approve', False)
-
-            if mcp_manager.hatch_env_manager.add_package_to_environment(package, env, version, force_download, refresh_registry, auto_approve):
-                self.logger.info(f"Successfully added package: {package}")
-            else:
-                self.logger.error(f"Failed to add package: {package}")
-                
-        except Exception as e:
-            self.logger.error(f"Error adding package: {e}")
+        env = parsed_args.get('env')
+        version = parsed_args.get('version')
+        force_download = parsed_args.get('force-download', False)
+        refresh_registry = parsed_args.get('refresh-registry', False)
+        auto_approve = parsed_args.get('auto-approve', False)
 
+        self._python_info_cache.clear()
+        if self.env_manager.add_package_to_environment(package, env, version, force_download, refresh_registry, auto_approve):
+            self.logger.info(f"Successfully added package: {package}")
+        else:
+            self.logger.error(f"Failed to add package: {package}")
+        
         return True
     
+    @_command_handler("removing package")
     def _cmd_pkg_remove(self, args: str) -> bool:
         """Remove a package from an environment.
         
@@ -662,31 +755,24 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'package_name': {'positional': True},
-            'env': {'aliases': ['e'], 'default': None}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
-        if 'package_name' not in parsed_args or not parsed_args['package_name']:
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:pkg:remove'])
+        package_name = parsed_args.get('package_name')
+        if not package_name:
             self.logger.error("Package name is required.")
             self._print_command_help('hatch:pkg:remove')
             return True
         
-        try:
-            package_name = parsed_args['package_name']
-            env = parsed_args.get('env')
-
-            if mcp_manager.hatch_env_manager.remove_package(package_name, env):
-                self.logger.info(f"Successfully removed package: {package_name}")
-            else:
-                self.logger.error(f"Failed to remove package: {package_name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error removing package: {e}")
+        env = parsed_args.get('env')
 
+        self._python_info_cache.clear()
+        if self.env_manager.remove_package(package_name, env):
+            self.logger.info(f"Successfully removed package: {package_name}")
+        else:
+            self.logger.error(f"Failed to remove package: {package_name}")
+        
         return True
 
+    @_command_handler("listing packages")
     def _cmd_pkg_list(self, args: str) -> bool:
         """List packages in an environment.
         
@@ -696,31 +782,26 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'env': {'aliases': ['e'], 'default': None}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:pkg:list'])
         env = parsed_args.get('env')
         
-        try:
-            packages = mcp_manager.hatch_env_manager.list_packages(env)
-            if not packages:
-                env_name = env if env else "current environment"
-                self.logger.info(f"No packages found in {env_name}.")
-                return True
-            
-            env_name = env if env else "current environment"
-            self.logger.info(f"Listing {len(packages)} packages in {env_name}")
-            print(f"Packages in {env_name}:")
-            for pkg in packages:
-                print(f"{pkg['name']} ({pkg['version']})  Hatch compliant: {pkg['hatch_compliant']} Source: {pkg['source']['uri']}  Location: {pkg['source']['path']}")
-                
-        except Exception as e:
-            self.logger.error(f"Error listing packages: {e}")
-            
+        packages = self.env_manager.list_packages(env)
+        env_name = self._resolve_env_name(env)
+        if not packages:
+            self.logger.info(f"No packages found in {env_name}.")
+            return True
+        
+        self.logger.info(f"Listing {len(packages)} packages in {env_name}")
+        lines = [f"Packages in {env_name}:"]
+        for pkg in packages:
+            source = pkg['source']
+            lines.append(f"{pkg['name']} ({pkg['version']})  Hatch compliant: {pkg['hatch_compliant']} Source: {source['uri']}  Location: {source['path']}")
+        # Write the whole listing at once
+        print_formatted_text(FormattedText([('', "\n".join(lines))]), style=self.style)
+        
         return True
     
+    @_command_handler("creating package template")
     def _cmd_create_package(self, args: str) -> bool:
         """Create a new package template.
         
@@ -730,36 +811,29 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'name': {'positional': True},
-            'dir': {'aliases': ['d'], 'default': '.'},
-            'description': {'aliases': ['D'], 'default': ''}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
-        if 'name' not in parsed_args or not parsed_args['name']:
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:pkg:create'])
+        name = parsed_args.get('name')
+        if not name:
             self.logger.error("Package name is required.")
             self._print_command_help('hatch:create')
             return True
         
-        try:
-            name = parsed_args['name']
-            target_dir = Path(parsed_args.get('dir', '.')).resolve()
-            description = parsed_args.get('description', '')
-            
-            package_dir = create_package_template(
-                target_dir=target_dir,
-                package_name=name,
-                description=description
-            )
-            
-            self.logger.info(f"Package template created at: {package_dir}")
-                
-        except Exception as e:
-            self.logger.error(f"Error creating package template: {e}")
-            
+        target_dir = _maybe_resolve(parsed_args.get('dir', '.'))
+        description = parsed_args.get('description', '')
+        
+        # Assumes Hatch is installed or available in the Python path
+        from hatch import create_package_template
+        package_dir = create_package_template(
+            target_dir=target_dir,
+            package_name=name,
+            description=description
+        )
+        
+        self.logger.info(f"Package template created at: {package_dir}")
+        
         return True
     
+    @_command_handler("validating package")
     def _cmd_validate_package(self, args: str) -> bool:
         """Validate a package.
         
@@ -769,49 +843,43 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'package_dir': {'positional': True}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
-        if 'package_dir' not in parsed_args or not parsed_args['package_dir']:
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:pkg:validate'])
+        package_dir = parsed_args.get('package_dir')
+        if not package_dir:
             self.logger.error("Package directory is required.")
             self._print_command_help('hatch:validate')
             return True
         
-        try:
-            package_path = Path(parsed_args['package_dir']).resolve()
-            
-            # Create validator with registry data from environment manager
-            from hatch_validator import HatchPackageValidator
-            validator = HatchPackageValidator(
-                version="latest",
-                allow_local_dependencies=True,
-                registry_data=mcp_manager.hatch_env_manager.registry_data
-            )
-            
-            # Validate the package
-            is_valid, validation_results = validator.validate_package(package_path)
+        package_path = _maybe_resolve(package_dir)
+        
+        # Create validator with registry data from environment manager
+        from hatch_validator import HatchPackageValidator
+        validator = HatchPackageValidator(
+            version="latest",
+            allow_local_dependencies=True,
+            registry_data=self.env_manager.registry_data
+        )
+        
+        # Validate the package
+        is_valid, validation_results = validator.validate_package(package_path)
+        
+        if is_valid:
+            self.logger.info(f"Package validation SUCCESSFUL: {package_path}")
+        else:
+            self.logger.warning(f"Package validation FAILED: {package_path}")
             
-            if is_valid:
-                self.logger.info(f"Package validation SUCCESSFUL: {package_path}")
-            else:
-                self.logger.warning(f"Package validation FAILED: {package_path}")
-                
-                # Print detailed validation results if available
-                if validation_results and isinstance(validation_results, dict):
-                    for category, result in validation_results.items():
-                        if category != 'valid' and category != 'metadata' and isinstance(result, dict):
-                            if not result.get('valid', True) and result.get('errors'):
-                                self.logger.warning(f"\n{category.replace('_', ' ').title()} errors:")
-                                for error in result['errors']:
-                                    self.logger.warning(f"  - {error}")
-
-        except Exception as e:
-            self.logger.error(f"Error validating package: {e}")
-
+            # Print detailed validation results if available
+            if validation_results and isinstance(validation_results, dict):
+                for category, result in validation_results.items():
+                    if category != 'valid' and category != 'metadata' and isinstance(result, dict):
+                        if not result.get('valid', True) and result.get('errors'):
+                            self.logger.warning(f"\n{category.replace('_', ' ').title()} errors:")
+                            for error in result['errors']:
+                                self.logger.warning(f"  - {error}")
+        
         return True
     
+    @_command_handler("initializing Python environment")
     def _cmd_env_python_init(self, args: str) -> bool:
         """Initialize Python environment for a Hatch environment.
         
@@ -830,59 +898,49 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'hatch_env': {'positional': False, 'default': None},
-            'python-version': {'default': None},
-            'force': {'default': False, 'is_flag': True},
-            'no-hatch-mcp-server': {'default': False, 'action': 'store_true'},
-            'hatch_mcp_server_tag': {'default': None}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:python:init'])
         hatch_env = parsed_args.get('hatch_env')
         python_version = parsed_args.get('python-version')
         force = parsed_args.get('force', False)
         no_hatch_mcp_server = parsed_args.get('no-hatch-mcp-server', False)
         hatch_mcp_server_tag = parsed_args.get('hatch_mcp_server_tag')
 
-        try:
-            if mcp_manager.hatch_env_manager.create_python_environment_only(
-                hatch_env, 
-                python_version, 
-                force,
-                no_hatch_mcp_server=no_hatch_mcp_server,
-                hatch_mcp_server_tag=hatch_mcp_server_tag
-            ):
-                env_name = hatch_env if hatch_env else "current environment"
-                self.logger.info(f"Python environment initialized for: {env_name}")
-                
-                if python_version:
-                    self.logger.info(f"Python version: {python_version}")
-                    
-                # Show Python environment info
-                python_info = mcp_manager.hatch_env_manager.get_python_environment_info(hatch_env)
-                if python_info:
-                    self.logger.info(f"  Python executable: {python_info['python_executable']}")
-                    self.logger.info(f"  Python version: {python_info.get('python_version', 'Unknown')}")
-                    self.logger.info(f"  Conda environment: {python_info.get('conda_env_name', 'N/A')}")
+        self._python_info_cache.clear()
+        if self.env_manager.create_python_environment_only(
+            hatch_env, 
+            python_version, 
+            force,
+            no_hatch_mcp_server=no_hatch_mcp_server,
+            hatch_mcp_server_tag=hatch_mcp_server_tag
+        ):
+            env_name = self._resolve_env_name(hatch_env)
+            self.logger.info(f"Python environment initialized for: {env_name}")
+            
+            if python_version:
+                self.logger.info(f"Python version: {python_version}")
                 
-                # Provide feedback about MCP server installation
-                if not no_hatch_mcp_server:
-                    if hatch_mcp_server_tag:
-                        self.logger.info(f"hatch_mcp_server installed with tag/branch: {hatch_mcp_server_tag}")
-                    else:
-                        self.logger.info("hatch_mcp_server installed with default branch")
+            # Show Python environment info
+            python_info = self._get_python_environment_info(hatch_env)
+            if python_info:
+                self.logger.info(f"  Python executable: {python_info['python_executable']}")
+                self.logger.info(f"  Python version: {python_info.get('python_version', 'Unknown')}")
+                self.logger.info(f"  Conda environment: {python_info.get('conda_env_name', 'N/A')}")
+            
+            # Provide feedback about MCP server installation
+            if not no_hatch_mcp_server:
+                if hatch_mcp_server_tag:
+                    self.logger.info(f"hatch_mcp_server installed with tag/branch: {hatch_mcp_server_tag}")
                 else:
-                    self.logger.info("hatch_mcp_server installation skipped (--no-hatch-mcp-server)")
+                    self.logger.info("hatch_mcp_server installed with default branch")
             else:
-                env_name = hatch_env if hatch_env else "current environment"
-                self.logger.error(f"Failed to initialize Python environment for: {env_name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error initializing Python environment: {e}")
-            
+                self.logger.info("hatch_mcp_server installation skipped (--no-hatch-mcp-server)")
+        else:
+            env_name = self._resolve_env_name(hatch_env)
+            self.logger.error(f"Failed to initialize Python environment for: {env_name}")
+        
         return True
     
+    @_command_handler("getting Python environment information")
     def _cmd_env_python_info(self, args: str) -> bool:
         """Show Python environment information.
         
@@ -892,53 +950,42 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'hatch_env': {'positional': False, 'default': None},
-            'detailed': {'default': False, 'is_flag': True}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:python:info'])
         hatch_env = parsed_args.get('hatch_env')
         detailed = parsed_args.get('detailed', False)
 
-        try:
-            env_name = hatch_env if hatch_env else "current environment"
-            
-            if detailed:
-                # Get detailed diagnostics
-                python_info = mcp_manager.hatch_env_manager.get_python_environment_diagnostics(hatch_env)
-                if python_info:
-                    self.logger.info(f"Detailed Python environment diagnostics for {env_name}:")
-                    for key, value in python_info.items():
-                        if isinstance(value, dict):
-                            self.logger.info(f"  {key}:")
-                            for sub_key, sub_value in value.items():
-                                self.logger.info(f"    {sub_key}: {sub_value}")
-                        else:
-                            self.logger.info(f"  {key}: {value}")
-                else:
-                    self.logger.info(f"No detailed Python environment diagnostics found for {env_name}.")
+        env_name = self._resolve_env_name(hatch_env)
+        
+        if detailed:
+            # Get detailed diagnostics
+            python_info = self.env_manager.get_python_environment_diagnostics(hatch_env)
+            if python_info:
+                lines = [f"Detailed Python environment diagnostics for {env_name}:"]
+                for key, value in python_info.items():
+                    if isinstance(value, dict):
+                        lines.append(f"  {key}:")
+                        lines.extend(f"    {sub_key}: {sub_value}" for sub_key, sub_value in value.items())
+                    else:
+                        lines.append(f"  {key}: {value}")
+                self.logger.info("\n".join(lines))
             else:
-                # Get basic info
-                python_info = mcp_manager.hatch_env_manager.get_python_environment_info(hatch_env)
-                if python_info:
-                    self.logger.info(f"Python environment information for {env_name}:")
-                    for key, value in python_info.items():
-                        if key == "packages":
-                            continue
-                        self.logger.info(f"  {key}: {value}")
-                    # List packages separately
-                    self.logger.info("  Packages:")
-                    for _pkg in python_info.get("packages", []):
-                        self.logger.info(f"    - {_pkg['name']} ({_pkg['version']})") 
-                else:
-                    self.logger.info(f"No Python environment information found for {env_name}.")
-                
-        except Exception as e:
-            self.logger.error(f"Error getting Python environment information: {e}")
-            
+                self.logger.info(f"No detailed Python environment diagnostics found for {env_name}.")
+        else:
+            # Get basic info
+            python_info = self._get_python_environment_info(hatch_env)
+            if python_info:
+                lines = [f"Python environment information for {env_name}:"]
+                lines.extend(f"  {key}: {value}" for key, value in python_info.items() if key != "packages")
+                # List packages separately
+                lines.append("  Packages:")
+                lines.extend(f"    - {_pkg['name']} ({_pkg['version']})" for _pkg in python_info.get("packages", []))
+                self.logger.info("\n".join(lines))
+            else:
+                self.logger.info(f"No Python environment information found for {env_name}.")
+        
         return True
     
+    @_command_handler("removing Python environment")
     def _cmd_env_python_remove(self, args: str) -> bool:
         """Remove Python environment.
         
@@ -948,33 +995,26 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'hatch_env': {'positional': False, 'default': None},
-            'force': {'default': False, 'is_flag': True}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:python:remove'])
         hatch_env = parsed_args.get('hatch_env')
         force = parsed_args.get('force', False)
 
-        try:
-            env_name = hatch_env if hatch_env else "current environment"
-            
-            if not force:
-                # Ask for confirmation if not forced
-                self.logger.warning(f"This will remove the Python environment for {env_name}. Use --force to skip confirmation.")
-                return True
-            
-            if mcp_manager.hatch_env_manager.remove_python_environment_only(hatch_env):
-                self.logger.info(f"Python environment removed for Hatch environment: {env_name}")
-            else:
-                self.logger.error(f"Failed to remove Python environment for Hatch environment: {env_name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error removing Python environment: {e}")
-            
+        env_name = self._resolve_env_name(hatch_env)
+        
+        if not force:
+            # Ask for confirmation if not forced
+            self.logger.warning(f"This will remove the Python environment for {env_name}. Use --force to skip confirmation.")
+            return True
+        
+        self._python_info_cache.clear()
+        if self.env_manager.remove_python_environment_only(hatch_env):
+            self.logger.info(f"Python environment removed for Hatch environment: {env_name}")
+        else:
+            self.logger.error(f"Failed to remove Python environment for Hatch environment: {env_name}")
+        
         return True
     
+    @_command_handler("launching Python shell")
     def _cmd_env_python_shell(self, args: str) -> bool:
         """Launch Python shell in environment.
         
@@ -984,31 +1024,23 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'hatch_env': {'positional': False, 'default': None},
-            'cmd': {'default': None}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:python:shell'])
         hatch_env = parsed_args.get('hatch_env')
         cmd = parsed_args.get('cmd')
 
-        try:
-            env_name = hatch_env if hatch_env else "current environment"
-            
-            if mcp_manager.hatch_env_manager.launch_python_shell(hatch_env, cmd):
-                if cmd:
-                    self.logger.info(f"Executing command '{cmd}' in Python environment for {env_name}")
-                else:
-                    self.logger.info(f"Python shell launched in Hatch environment: {env_name}")
+        env_name = self._resolve_env_name(hatch_env)
+        
+        if self.env_manager.launch_python_shell(hatch_env, cmd):
+            if cmd:
+                self.logger.info(f"Executing command '{cmd}' in Python environment for {env_name}")
             else:
-                self.logger.error(f"Failed to launch Python shell in Hatch environment: {env_name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error launching Python shell: {e}")
-            
+                self.logger.info(f"Python shell launched in Hatch environment: {env_name}")
+        else:
+            self.logger.error(f"Failed to launch Python shell in Hatch environment: {env_name}")
+        
         return True
     
+    @_command_handler("installing hatch_mcp_server wrapper")
     def _cmd_env_python_add_hatch_mcp(self, args: str) -> bool:
         """Add hatch_mcp_server wrapper to the environment.
         
@@ -1024,28 +1056,21 @@ class HatchCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session.
         """
-        arg_defs = {
-            'hatch_env': {'positional': False, 'default': None},
-            'tag': {'default': None}
-        }
-        
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['hatch:env:python:add-hatch-mcp'])
         hatch_env = parsed_args.get('hatch_env')
         tag = parsed_args.get('tag')
 
-        try:
-            env_name = hatch_env if hatch_env else mcp_manager.hatch_env_manager.get_current_environment()
-            
-            if mcp_manager.hatch_env_manager.install_mcp_server(hatch_env, tag):
-                self.logger.info(f"hatch_mcp_server wrapper installed successfully in environment: {env_name}")
-                if tag:
-                    self.logger.info(f"Using tag/branch: {tag}")
-                else:
-                    self.logger.info("Using default branch")
+        env_name = hatch_env if hatch_env else self.env_manager.get_current_environment()
+        
+        self._python_info_cache.clear()
+        if self.env_manager.install_mcp_server(hatch_env, tag):
+            self.logger.info(f"hatch_mcp_server wrapper installed successfully in environment: {env_name}")
+            if tag:
+                self.logger.info(f"Using tag/branch: {tag}")
             else:
-                self.logger.error(f"Failed to install hatch_mcp_server wrapper in environment: {env_name}")
-                
-        except Exception as e:
-            self.logger.error(f"Error installing hatch_mcp_server wrapper: {e}")
+                self.logger.info("Using default branch")
+        else:
+            self.logger.error(f"Failed to install hatch_mcp_server wrapper in environment: {env_name}")
+            
             
         return True
\ No newline at end of file
@@ -4,9 +4,6 @@ This module provides CLI commands for managing LLM models and providers.
 Commands follow the format 'llm:target:action' for clarity and consistency.
 """
 
-from prompt_toolkit import print_formatted_text
-from prompt_toolkit.formatted_text import FormattedText
-
 from hatchling.ui.abstract_commands import AbstractCommands
 from hatchling.core.llm.model_manager_api import ModelManagerAPI
 from hatchling.config.llm_settings import LLMSettings
@@ -104,14 +101,12 @@ class ModelCommands(AbstractCommands):
             }
         }
 
-    def print_commands_help(self) -> None:
-        """Print help for all available chat commands."""
-        print_formatted_text(FormattedText([
-            ('class:header', "\n=== Model Commands ===\n")
-        ]), style=self.style)
-
-        # Call parent class method to print formatted commands
-        super().print_commands_help()
+    def render_commands_help(self) -> list:
+        """Render help for all available chat commands, preceded by a header."""
+        return [
+            ('class:header', "\n=== Model Commands ===\n"),
+            ('', '\n')
+        ] + super().render_commands_help()
     
     # =============================================================================
     # Provider Management Commands
@@ -7,218 +7,284 @@ management through the chat interface.
 
 import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List
 
-import yaml
-
 from prompt_toolkit import PromptSession, print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
 
 from hatchling.config.i18n import translate
-from hatchling.ui.abstract_commands import AbstractCommands
-
-
-class SettingsCommands(AbstractCommands):
-    """Handles settings-related command operations in the chat interface."""
-
-    def _register_commands(self) -> None:
-        """Register all settings-related commands."""
-        self.commands = {
-            'settings:list': {
-                'handler': self._cmd_settings_list,
-                'description': translate("commands.settings.list_description"),
-                'is_async': False,
-                'args': {
-                    'filter': {
-                        'positional': True,
-                        'description': translate("commands.args.filter_description"),
-                        'default': None,
-                        'required': False
-                    },
-                    'format': {
-                        'positional': False,
-                        'description': translate("commands.args.format_description"),
-                        'default': "table",
-                        'completer_type': 'suggestions',
-                        'values': ["table", "json", "yaml"],
-                        'required': False
-                    }
-                }
+from hatchling.config.settings import SettingAccessLevel
+from hatchling.ui.abstract_commands import AbstractCommands, compile_arg_defs, translate_arg_schema
+
+
+# Settings file formats by file extension; other extensions default to TOML
+_FORMATS_BY_SUFFIX = {".toml": "toml", ".json": "json", ".yaml": "yaml", ".yml": "yaml"}
+
+# Strings accepted as True for boolean settings
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on", "enabled"))
+
+# Display names of the access levels; plain strings map to themselves through the str enum
+_ACCESS_LEVEL_NAMES = {level: level.value for level in SettingAccessLevel}
+
+# Placeholder for the setting paths known to the registry, filled in per instance
+_SETTING_PATHS = object()
+
+# Static command schema. Handlers are given by method name and descriptions by
+# translation key; both are resolved per instance in `_register_commands`.
+_COMMAND_SCHEMA = {
+    'settings:list': {
+        'handler': '_cmd_settings_list',
+        'description_key': 'commands.settings.list_description',
+        'is_async': False,
+        'args': {
+            'filter': {
+                'positional': True,
+                'description_key': 'commands.args.filter_description',
+                'default': None,
+                'required': False
             },
-            'settings:get': {
-                'handler': self._cmd_settings_get,
-                'description': translate("commands.settings.get_description"),
-                'is_async': False,
-                'args': {
-                    'setting': {
-                        'positional': True,
-                        'completer_type': 'suggestions',
-                        'values': self._get_available_settings(),
-                        'description': translate("commands.args.setting_description"),
-                        'required': True
-                    }
-                }
+            'format': {
+                'positional': False,
+                'description_key': 'commands.args.format_description',
+                'default': "table",
+                'completer_type': 'suggestions',
+                'values': ["table", "json", "yaml"],
+                'required': False
+            }
+        }
+    },
+    'settings:get': {
+        'handler': '_cmd_settings_get',
+        'description_key': 'commands.settings.get_description',
+        'is_async': False,
+        'args': {
+            'setting': {
+                'positional': True,
+                'completer_type': 'suggestions',
+                'values': _SETTING_PATHS,
+                'description_key': 'commands.args.setting_description',
+                'required': True
+            }
+        }
+    },
+    'settings:set': {
+        'handler': '_cmd_settings_set',
+        'description_key': 'commands.settings.set_description',
+        'is_async': True,
+        'args': {
+            'setting': {
+                'positional': True,
+                'completer_type': 'suggestions',
+                'values': _SETTING_PATHS,
+                'description_key': 'commands.args.setting_description',
+                'required': True
             },
-            'settings:set': {
-                'handler': self._cmd_settings_set,
-                'description': translate("commands.settings.set_description"),
-                'is_async': True,
-                'args': {
-                    'setting': {
-                        'positional': True,
-                        'completer_type': 'suggestions',
-                        'values': self._get_available_settings(),
-                        'description': translate("commands.args.setting_description"),
-                        'required': True
-                    },
-                    'value': {
-                        'positional': True,
-                        'description': translate("commands.args.value_description"),
-                        'required': True
-                    },
-                    'force-confirm': {
-                        'positional': False,
-                        'description': translate("commands.args.force_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'force-protected': {
-                        'positional': False,
-                        'description': translate("commands.args.force_protected_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
-                }
+            'value': {
+                'positional': True,
+                'description_key': 'commands.args.value_description',
+                'required': True
             },
-            'settings:reset': {
-                'handler': self._cmd_settings_reset,
-                'description': translate("commands.settings.reset_description"),
-                'is_async': True,
-                'args': {
-                    'setting': {
-                        'positional': True,
-                        'completer_type': 'suggestions',
-                        'values': self._get_available_settings(),
-                        'description': translate("commands.args.setting_description"),
-                        'required': True
-                    },
-                    'force-confirmed': {
-                        'positional': False,
-                        'description': translate("commands.args.force_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'force-protected': {
-                        'positional': False,
-                        'description': translate("commands.args.force_protected_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
-                }
+            'force-confirm': {
+                'positional': False,
+                'description_key': 'commands.args.force_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            'settings:export': {
-                'handler': self._cmd_settings_export,
-                'description': translate("commands.settings.export_description"),
-                'is_async': False,
-                'args': {
-                    'file': {
-                        'positional': True,
-                        'completer_type': 'path',
-                        'description': translate("commands.args.file_description"),
-                        'required': True
-                    },
-                    'format': {
-                        'positional': False,
-                        'completer_type': 'suggestions',
-                        'values': ["json", "yaml", "toml"],
-                        'description': translate("commands.args.format_description"),
-                        'default': "toml",
-                        'required': False
-                    },
-                    'all': {
-                        'positional': False,
-                        'description': translate("commands.args.all_settings_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
-                }
+            'force-protected': {
+                'positional': False,
+                'description_key': 'commands.args.force_protected_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'settings:reset': {
+        'handler': '_cmd_settings_reset',
+        'description_key': 'commands.settings.reset_description',
+        'is_async': True,
+        'args': {
+            'setting': {
+                'positional': True,
+                'completer_type': 'suggestions',
+                'values': _SETTING_PATHS,
+                'description_key': 'commands.args.setting_description',
+                'required': True
             },
-            'settings:save': {
-                'handler': self._cmd_settings_save,
-                'description': translate("commands.settings.save_description"),
-                'is_async': False,
-                'args': {
-                    'format': {
-                            'positional': False,
-                            'completer_type': 'suggestions',
-                            'values': ["json", "yaml", "toml"],
-                            'description': translate("commands.args.format_description"),
-                            'default': "toml",
-                            'required': False
-                        }
-                }
+            'force-confirmed': {
+                'positional': False,
+                'description_key': 'commands.args.force_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            'settings:import': {
-                'handler': self._cmd_settings_import,
-                'description': translate("commands.settings.import_description"),
-                'is_async': True,
-                'args': {
-                    'file': {
-                        'positional': True,
-                        'completer_type': 'path',
-                        'description': translate("commands.args.file_description"),
-                        'required': True
-                    },
-                    'force-confirm': {
-                        'positional': False,
-                        'description': translate("commands.args.force_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    },
-                    'force-protected': {
-                        'positional': False,
-                        'description': translate("commands.args.force_protected_description"),
-                        'default': False,
-                        'is_flag': True,
-                        'required': False
-                    }
+            'force-protected': {
+                'positional': False,
+                'description_key': 'commands.args.force_protected_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'settings:export': {
+        'handler': '_cmd_settings_export',
+        'description_key': 'commands.settings.export_description',
+        'is_async': False,
+        'args': {
+            'file': {
+                'positional': True,
+                'completer_type': 'path',
+                'description_key': 'commands.args.file_description',
+                'required': True
+            },
+            'format': {
+                'positional': False,
+                'completer_type': 'suggestions',
+                'values': ["json", "yaml", "toml"],
+                'description_key': 'commands.args.format_description',
+                'default': "toml",
+                'required': False
+            },
+            'all': {
+                'positional': False,
+                'description_key': 'commands.args.all_settings_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'settings:save': {
+        'handler': '_cmd_settings_save',
+        'description_key': 'commands.settings.save_description',
+        'is_async': False,
+        'args': {
+            'format': {
+                    'positional': False,
+                    'completer_type': 'suggestions',
+                    'values': ["json", "yaml", "toml"],
+                    'description_key': 'commands.args.format_description',
+                    'default': "toml",
+                    'required': False
                 }
+        }
+    },
+    'settings:import': {
+        'handler': '_cmd_settings_import',
+        'description_key': 'commands.settings.import_description',
+        'is_async': True,
+        'args': {
+            'file': {
+                'positional': True,
+                'completer_type': 'path',
+                'description_key': 'commands.args.file_description',
+                'required': True
             },
-            'settings:language:list': {
-                'handler': self._cmd_language_list,
-                'description': translate("commands.settings.language_list_description"),
-                'is_async': False,
-                'args': {}
+            'force-confirm': {
+                'positional': False,
+                'description_key': 'commands.args.force_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
             },
-            'settings:language:set': {
-                'handler': self._cmd_language_set,
-                'description': translate("commands.settings.language_set_description"),
-                'is_async': False,
+            'force-protected': {
+                'positional': False,
+                'description_key': 'commands.args.force_protected_description',
+                'default': False,
+                'is_flag': True,
+                'required': False
+            }
+        }
+    },
+    'settings:language:list': {
+        'handler': '_cmd_language_list',
+        'description_key': 'commands.settings.language_list_description',
+        'is_async': False,
+        'args': {}
+    },
+    'settings:language:set': {
+        'handler': '_cmd_language_set',
+        'description_key': 'commands.settings.language_set_description',
+        'is_async': False,
+        'args': {
+            'language': {
+                'positional': True,
+                'completer_type': 'languages',
+                'description_key': 'commands.args.language_description',
+                'required': True
+            }
+        }
+    }
+}
+
+
+# Argument definitions of each command, to parse its arguments with (read-only)
+_ARG_DEFS = MappingProxyType({
+    cmd_name: compile_arg_defs(cmd_schema['args'])
+    for cmd_name, cmd_schema in _COMMAND_SCHEMA.items()
+})
+
+
+class SettingsCommands(AbstractCommands):
+    """Handles settings-related command operations in the chat interface."""
+
+    __slots__ = ("_consent_session",)
+
+    def __init__(self, chat_session, settings_registry, style=None):
+        """Initialize the settings command handler.
+
+        Args:
+            chat_session: The chat session this handler is associated with.
+            settings_registry (SettingsRegistry): The settings registry.
+            style (Optional[Style]): Style for formatting command output.
+        """
+        # Prompt session for y/N confirmations, created on first use
+        self._consent_session = None
+        super().__init__(chat_session, settings_registry, style)
+
+    def _register_commands(self) -> None:
+        """Register all settings-related commands."""
+        # Shared by the commands that complete setting names
+        available_settings = self._get_available_settings()
+        
+        self.commands = {
+            cmd_name: {
+                'handler': getattr(self, cmd_schema['handler']),
+                'description': translate(cmd_schema['description_key']),
+                'is_async': cmd_schema['is_async'],
                 'args': {
-                    'language': {
-                        'positional': True,
-                        'completer_type': 'languages',
-                        'description': translate("commands.args.language_description"),
-                        'required': True
-                    }
+                    arg_name: self._translate_setting_arg(arg_schema, available_settings)
+                    for arg_name, arg_schema in cmd_schema['args'].items()
                 }
             }
+            for cmd_name, cmd_schema in _COMMAND_SCHEMA.items()
         }
     
-    def print_commands_help(self) -> None:
-        """Print help for all available chat commands."""
-        print_formatted_text(FormattedText([
-            ('class:header', "\n=== Settings Commands ===\n")
-        ]), style=self.style)
-
-        # Call parent class method to print formatted commands
-        super().print_commands_help()
+    @staticmethod
+    def _translate_setting_arg(arg_schema: Dict[str, Any], available_settings: List[str]) -> Dict[str, Any]:
+        """Get the argument metadata for an argument schema, with setting paths filled in.
+        
+        Args:
+            arg_schema (Dict[str, Any]): Argument schema from `_COMMAND_SCHEMA`.
+            available_settings (List[str]): Setting paths offered as completions.
+            
+        Returns:
+            Dict[str, Any]: The argument metadata, in the current language.
+        """
+        arg_info = translate_arg_schema(arg_schema)
+        if arg_info.get('values') is _SETTING_PATHS:
+            arg_info['values'] = available_settings
+        return arg_info
+    
+    def render_commands_help(self) -> list:
+        """Render help for all available chat commands, preceded by a header."""
+        return [
+            ('class:header', "\n=== Settings Commands ===\n"),
+            ('', '\n')
+        ] + super().render_commands_help()
     
     def _cmd_settings_list(self, args: str) -> bool:
         """List all available settings with optional filtering.
@@ -229,9 +295,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:list']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:list'])
         filter_pattern = parsed_args.get('filter')
         output_format = parsed_args.get('format', "table")
 
@@ -255,9 +319,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:get']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:get'])
         setting_path = parsed_args.get('setting')
 
         if not setting_path:
@@ -287,9 +349,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:set']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:set'])
         setting_path = parsed_args.get('setting')
         value = parsed_args.get('value')
         force_confirm = parsed_args.get('force-confirm', False)
@@ -305,9 +365,10 @@ class SettingsCommands(AbstractCommands):
 
         try:
             category, name = self._parse_setting_path(setting_path)
+            full_path = f"{category}:{name}"
 
             if not force_confirm:
-                if not await self._request_user_consent(translate("prompts.confirm_set", setting=f"{category}:{name}", value=value)):
+                if not await self._request_user_consent(translate("prompts.confirm_set", setting=full_path, value=value)):
                     self._print_info(translate("info.operation_cancelled"))
                     return True
 
@@ -316,10 +377,10 @@ class SettingsCommands(AbstractCommands):
             success = self.settings_registry.set_setting(category, name, typed_value, force=force_protected)
             if success:
                 self._print_success(translate("info.setting_updated",
-                                              setting=f"{category}:{name}",
+                                              setting=full_path,
                                               value=str(typed_value)))
             else:
-                self._print_error(translate("errors.set_setting_failed", setting=f"{category}:{name}"))
+                self._print_error(translate("errors.set_setting_failed", setting=full_path))
         except ValueError as e:
             self._print_error(str(e))
         except Exception as e:
@@ -335,9 +396,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:reset']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:reset'])
         setting_path = parsed_args.get('setting')
         force_confirm = parsed_args.get('force-confirm', False)
         force_protected = parsed_args.get('force-protected', False)
@@ -352,16 +411,17 @@ class SettingsCommands(AbstractCommands):
 
         try:
             category, name = self._parse_setting_path(setting_path)
+            full_path = f"{category}:{name}"
             if not force_confirm:
-                if not await self._request_user_consent(translate("prompts.confirm_reset", setting=f"{category}:{name}")):
+                if not await self._request_user_consent(translate("prompts.confirm_reset", setting=full_path)):
                     self._print_info(translate("info.operation_cancelled"))
                     return True
 
             success = self.settings_registry.reset_setting(category, name, force=force_protected)
             if success:
-                self._print_success(translate("info.setting_reset", setting=f"{category}:{name}"))
+                self._print_success(translate("info.setting_reset", setting=full_path))
             else:
-                self._print_error(translate("errors.reset_setting_failed", setting=f"{category}:{name}"))
+                self._print_error(translate("errors.reset_setting_failed", setting=full_path))
         except ValueError as e:
             self._print_error(str(e))
         except Exception as e:
@@ -377,9 +437,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:export']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:export'])
         file_path = parsed_args.get('file')
         file_format = parsed_args.get('format')
         all_settings = parsed_args.get('all', False)
@@ -415,9 +473,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:save']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:save'])
         file_format = parsed_args.get('format', "toml")
 
         if not self.settings_registry:
@@ -441,9 +497,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             bool: True to continue the chat session, False to exit.
         """
-        arg_defs = self.commands['settings:import']['args']
-
-        parsed_args = self._parse_args(args, arg_defs)
+        parsed_args = self._parse_args(args, _ARG_DEFS['settings:import'])
         file_path = parsed_args.get('file')
         force_confirm = parsed_args.get('force-confirm', False)
         force_protected = parsed_args.get('force-protected', False)
@@ -521,7 +575,9 @@ class SettingsCommands(AbstractCommands):
             bool: True if user approves, False otherwise.
         """        
         # Request confirmation
-        session = PromptSession()
+        if self._consent_session is None:
+            self._consent_session = PromptSession()
+        session = self._consent_session
         while True:
             response = (await session.prompt_async(f"\n{message} [y/N]: ")).strip().lower()
             if response in ['y', 'yes']:
@@ -543,14 +599,11 @@ class SettingsCommands(AbstractCommands):
         Raises:
             ValueError: If path format is invalid.
         """
-        if ":" not in setting_path:
+        category, sep, name = setting_path.partition(":")
+        if not sep or not category or not name:
             raise ValueError(translate("errors.invalid_setting_path", path=setting_path))
         
-        parts = setting_path.split(":", 1)
-        if len(parts) != 2 or not parts[0] or not parts[1]:
-            raise ValueError(translate("errors.invalid_setting_path", path=setting_path))
-        
-        return parts[0], parts[1]
+        return category, name
     
     def _convert_value(self, value: str, current_value: Any) -> Any:
         """Convert string value to appropriate type based on current value.
@@ -568,7 +621,7 @@ class SettingsCommands(AbstractCommands):
             return None
 
         if isinstance(current_value, bool):
-            return value.lower() in ("true", "1", "yes", "on", "enabled")
+            return value.lower() in _TRUE_STRINGS
         elif isinstance(current_value, int):
             return int(value)
         elif isinstance(current_value, float):
@@ -585,15 +638,7 @@ class SettingsCommands(AbstractCommands):
         Returns:
             str: Detected format ("toml", "json", or "yaml").
         """
-        suffix = file_path.suffix.lower()
-        if suffix == ".toml":
-            return "toml"
-        elif suffix == ".json":
-            return "json"
-        elif suffix in (".yaml", ".yml"):
-            return "yaml"
-        else:
-            return "toml"  # Default to TOML
+        return _FORMATS_BY_SUFFIX.get(file_path.suffix.lower(), "toml")
     
     def _output_settings_list(self, settings: List[Dict[str, Any]], format_type: str) -> None:
         """Output settings list in specified format.
@@ -603,31 +648,48 @@ class SettingsCommands(AbstractCommands):
             format_type (str): Output format ("table", "json", or "yaml").
         """
         if format_type == "json":
-            print(json.dumps(self.settings_registry.make_serializable(settings), indent=2))
-        elif format_type == "yaml" and yaml:
-            print(yaml.dump(self.settings_registry.make_serializable(settings), default_flow_style=False))
+            # Serialized settings are acyclic, so the circular reference check is skipped
+            print(json.dumps(self.settings_registry.make_serializable(settings), indent=2,
+                             ensure_ascii=False, check_circular=False))
+        elif format_type == "yaml":
+            import yaml
+            # Output is for reading only: keep unicode as is and do not fold long lines
+            print(yaml.dump(self.settings_registry.make_serializable(settings),
+                            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                            default_flow_style=False, sort_keys=False,
+                            allow_unicode=True, width=1 << 20, indent=2))
         else:
-            # Table format (default)
-            self._print_header(translate("headers.settings_list"))
+            # Table format (default), written in a single call
+            lines = [("class:header", translate("headers.settings_list"))]
+            description_label = translate('common.description')
+            current_label = translate('common.current')
+            default_label = translate('common.default')
             
             for setting in settings:
                 # Group by category
                 category_display_name = setting.get("category_display_name", setting["category_name"])
-                self._print_subheader(f"[{category_display_name}] ({setting['category_name']})")
+                lines.append(("class:subheader", f"[{category_display_name}] ({setting['category_name']})"))
 
                 # Format setting info
                 display_name = setting.get("display_name", setting["name"])
-                access_level = setting["access_level"].value if hasattr(setting["access_level"], "value") else setting["access_level"]
+                access_level = _ACCESS_LEVEL_NAMES.get(setting["access_level"], setting["access_level"])
                 
-                self._print_info(f"  {display_name} ({setting['name']})")
-                self._print_detail(f"    {translate('common.description')}: {setting['description']}")
-                self._print_detail(f"    {translate('common.current')}: {setting['current_value']}")
-                self._print_detail(f"    {translate('common.default')}: {setting['default_value']}")
-                self._print_detail(f"    Access: {access_level}")
+                lines.append(("class:info", f"  {display_name} ({setting['name']})"))
+                lines.append(("class:detail", f"    {description_label}: {setting['description']}"))
+                lines.append(("class:detail", f"    {current_label}: {setting['current_value']}"))
+                lines.append(("class:detail", f"    {default_label}: {setting['default_value']}"))
+                lines.append(("class:detail", f"    Access: {access_level}"))
                 
                 if setting.get("hint"):
-                    self._print_detail(f"    Hint: {setting['hint']}")
-                print()
+                    lines.append(("class:detail", f"    Hint: {setting['hint']}"))
+                lines.append(("", ""))
+            
+            fragments = []
+            for line in lines:
+                fragments.append(line)
+                fragments.append(("", "\n"))
+            fragments.pop()
+            print_formatted_text(FormattedText(fragments), style=self.style)
     
     def _output_setting_info(self, setting: Dict[str, Any]) -> None:
         """Output detailed information for a single setting.
@@ -637,7 +699,7 @@ class SettingsCommands(AbstractCommands):
         """
         display_name = setting.get("display_name", setting["name"])
         category_name = setting.get("category_display_name", setting["category_name"])
-        access_level = setting["access_level"].value if hasattr(setting["access_level"], "value") else setting["access_level"]
+        access_level = _ACCESS_LEVEL_NAMES.get(setting["access_level"], setting["access_level"])
         
         self._print_header(f"{category_name}: {display_name}")
         self._print_info(f"{translate('common.name')}: {setting['name']}")
@@ -660,7 +722,7 @@ class SettingsCommands(AbstractCommands):
         if not self.settings_registry:
             return []
 
-        return [f"{setting['category_name']}:{setting['name']}" for setting in self.settings_registry.list_settings()]
+        return list(self.settings_registry.get_setting_paths())
     
     def _print_header(self, text: str) -> None:
         """Print a formatted header."""
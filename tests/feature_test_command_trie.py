@@ -0,0 +1,84 @@
+"""Feature tests for the command prefix tree.
+
+This test suite validates the CommandTrie used by command completion: exact
+lookups, membership and prefix iteration.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.test_decorators import feature_test
+
+from hatchling.ui.command_trie import CommandTrie
+
+
+class TestCommandTrie(unittest.TestCase):
+    """Test suite for CommandTrie."""
+
+    def setUp(self):
+        """Set up a trie with namespaced commands sharing prefixes."""
+        self.trie = CommandTrie([
+            ('help', 'help_info'),
+            ('settings:list', 'list_info'),
+            ('settings:language:set', 'language_set_info'),
+            ('settings:language:list', 'language_list_info'),
+        ])
+
+    @feature_test
+    def test_exact_lookup(self):
+        """Test that only complete command names are found."""
+        self.assertEqual(self.trie.get('settings:language:set'), 'language_set_info')
+        self.assertIsNone(self.trie.get('settings:language'), "Prefixes should not match")
+        self.assertIsNone(self.trie.get('unknown'), "Unknown commands should not match")
+        self.assertEqual(self.trie.get('unknown', 'default'), 'default')
+
+    @feature_test
+    def test_membership_and_size(self):
+        """Test membership checks and size, including replaced entries."""
+        self.assertIn('help', self.trie)
+        self.assertNotIn('hel', self.trie)
+        self.trie.insert('help', 'new_help_info')
+        self.assertEqual(len(self.trie), 4, "Replacing a command should not change the size")
+        self.assertEqual(self.trie.get('help'), 'new_help_info')
+
+    @feature_test
+    def test_prefix_iteration(self):
+        """Test that prefix iteration yields all matching commands in insertion order."""
+        self.assertEqual(
+            [name for name, _ in self.trie.items('settings:la')],
+            ['settings:language:set', 'settings:language:list']
+        )
+        self.assertEqual(len(list(self.trie.items())), 4)
+        self.assertEqual(list(self.trie.items('mcp:')), [])
+
+    @feature_test
+    def test_iteration_keeps_registration_order(self):
+        """Test that commands sharing a longer prefix are not grouped ahead of earlier ones."""
+        trie = CommandTrie([
+            ('settings:list', 'list_info'),
+            ('settings:language:list', 'language_list_info'),
+            ('settings:get', 'get_info'),
+        ])
+        trie.insert('settings:list', 'new_list_info')
+        self.assertEqual(
+            list(trie.items('settings:')),
+            [('settings:list', 'new_list_info'), ('settings:language:list', 'language_list_info'),
+             ('settings:get', 'get_info')]
+        )
+
+
+def run_command_trie_feature_tests() -> bool:
+    """Run all command trie feature tests."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCommandTrie)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    success = run_command_trie_feature_tests()
+    sys.exit(0 if success else 1)
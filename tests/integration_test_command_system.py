@@ -25,6 +25,7 @@ from tests.test_decorators import integration_test
 from hatchling.ui.mcp_commands import MCPCommands
 from hatchling.ui.model_commands import ModelCommands
 from hatchling.ui.chat_command_handler import ChatCommandHandler
+from hatchling.ui.abstract_commands import compile_arg_defs
 from hatchling.core.llm.chat_session import ChatSession
 from hatchling.config.settings_registry import SettingsRegistry
 from hatchling.mcp_utils.mcp_tool_data import MCPToolInfo, MCPToolStatus, MCPToolStatusReason
@@ -121,6 +122,21 @@ class TestCommandSystemIntegration(AsyncTestCase):
         for cmd_name in model_commands.keys():
             self.assertIn(':', cmd_name, f"Command {cmd_name} should use colon separator")
     
+    @integration_test
+    def test_command_completer_per_handler(self):
+        """Test that each command handler completes against its own command tables."""
+        other_handler = ChatCommandHandler(self.mock_chat_session, self.mock_settings_registry, self.command_style)
+        self.assertIsNot(other_handler.command_completer, self.cmd_handler.command_completer)
+        self.assertIs(other_handler.command_completer.completer.commands, other_handler.get_all_command_metadata())
+
+    @integration_test
+    def test_command_completion_order(self):
+        """Test that command name completions follow the order in which commands were registered."""
+        completer = self.cmd_handler.command_completer.completer
+        completions = [completion.text for completion in completer._get_command_completions("settings:")]
+        registered = [name for name in self.cmd_handler.get_all_command_metadata() if name.startswith("settings:")]
+        self.assertEqual(completions, registered)
+
     @integration_test
     def test_mcp_command_structure(self):
         """Test MCP command structure and validation."""
@@ -215,7 +231,63 @@ class TestCommandSystemIntegration(AsyncTestCase):
         arg_defs = self.cmd_handler.model_commands.commands['llm:provider:status']['args']
         args = self.cmd_handler.model_commands._parse_args("--provider-name openai", arg_defs)
         self.assertEqual(args, {"provider-name": "openai"})
-    
+
+    @integration_test
+    def test_compiled_argument_parsing(self):
+        """Test that compiled argument definitions parse like the definitions they come from."""
+        arg_defs = self.cmd_handler.hatch_commands.commands['hatch:pkg:add']['args']
+        compiled = compile_arg_defs(arg_defs)
+        args_str = "my_pkg -e test_env --version 1.0 -y"
+        args = self.cmd_handler.hatch_commands._parse_args(args_str, compiled)
+        self.assertEqual(args, self.cmd_handler.hatch_commands._parse_args(args_str, arg_defs))
+        self.assertEqual(args['package_path_or_name'], "my_pkg")
+        self.assertEqual(args['env'], "test_env", "Aliases should resolve to their argument")
+        self.assertEqual(args['version'], "1.0")
+        self.assertTrue(args['auto-approve'])
+        self.assertFalse(args['force-download'], "Unset arguments should keep their default")
+
+        # Repeated argument strings are served from the cache, as independent copies
+        args['env'] = "mutated"
+        cached_args = self.cmd_handler.hatch_commands._parse_args(args_str, compiled)
+        self.assertIn(args_str, compiled.parsed)
+        self.assertEqual(cached_args['env'], "test_env", "Cached results should not be shared with callers")
+
+    @integration_test
+    def test_language_switch_keeps_argument_values(self):
+        """Test that restoring the command tables of a language keeps updated suggestions."""
+        self.mock_settings_registry.get_current_language.return_value = "en"
+        self.cmd_handler._register_commands()
+        self.mock_settings_registry.get_current_language.return_value = "fr"
+        self.cmd_handler._register_commands()
+
+        # Updated in place, as after pulling or removing a model
+        model_commands = self.cmd_handler.model_commands.commands
+        model_commands['llm:model:use']['args']['model-name']['values'] = ["pulled-model"]
+
+        self.mock_settings_registry.get_current_language.return_value = "en"
+        self.cmd_handler._register_commands()
+        model_arg = self.cmd_handler.get_all_command_metadata()['llm:model:use']['args']['model-name']
+        self.assertEqual(model_arg['values'], ["pulled-model"])
+        self.assertIs(self.cmd_handler.model_commands.commands['llm:model:use']['args']['model-name'], model_arg)
+
+    @integration_test
+    def test_python_info_cache(self):
+        """Test that Python environment info is reused until an environment changes."""
+        hatch_commands = self.cmd_handler.hatch_commands
+        env_manager = MagicMock()
+        env_manager.get_python_environment_info.return_value = {'python_version': '3.12', 'packages': []}
+
+        with patch.object(type(hatch_commands), 'env_manager', env_manager):
+            hatch_commands._cmd_env_python_info("")
+            hatch_commands._cmd_env_python_info("")
+            self.assertEqual(env_manager.get_python_environment_info.call_count, 1,
+                             "Repeated queries should be served from the cache")
+
+            hatch_commands._cmd_env_python_remove("--force")
+            hatch_commands._cmd_env_python_info("")
+            self.assertEqual(env_manager.get_python_environment_info.call_count, 2,
+                             "Changing an environment should invalidate the cache")
+
     @integration_test
     def test_mcp_server_list_command(self):
         """Test MCP server list command execution."""
@@ -0,0 +1,146 @@
+"""Regression tests for provider-specific histories in MessageHistory.
+
+These tests ensure that the histories kept per provider stay in step with the
+canonical history when switching providers, including entries that cannot be
+formatted for a provider.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tests.test_decorators import regression_test
+
+from hatchling.config.llm_settings import ELLMProvider
+from hatchling.core.chat.message_history import MessageHistory
+from hatchling.core.llm.event_system import Event, EventType
+
+
+class TestMessageHistoryRegression(unittest.TestCase):
+    """Regression tests for provider history syncing."""
+
+    def setUp(self):
+        """Patch the provider registry with providers formatting tool calls by name."""
+        self.failing_providers = set()
+        patcher = patch(
+            "hatchling.core.chat.message_history.ProviderRegistry.get_provider",
+            side_effect=self._get_provider
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_provider(self, provider):
+        """Get a mock provider, failing like a provider whose client cannot be created."""
+        if provider in self.failing_providers:
+            raise ValueError(f"Provider {provider.value} is not available")
+        mock_provider = MagicMock()
+        mock_provider.hatchling_to_llm_tool_call.side_effect = lambda tool_call: {
+            "id": tool_call.tool_call_id, "provider": provider.value
+        }
+        # Like the real providers, read the content of the result
+        mock_provider.hatchling_to_provider_tool_result.side_effect = lambda tool_result: {
+            "tool_call_id": tool_result.tool_call_id, "provider": provider.value,
+            "content": tool_result.result.content
+        }
+        return mock_provider
+
+    def _dispatch_tool_call(self, history, provider, tool_call_id):
+        """Publish a tool call dispatched by the given provider."""
+        history.on_event(Event(
+            type=EventType.MCP_TOOL_CALL_DISPATCHED,
+            data={"tool_call_id": tool_call_id, "function_name": "tool", "arguments": {}},
+            provider=provider
+        ))
+
+    def _fail_tool_call(self, history, provider, tool_call_id):
+        """Publish a tool call error without a result, as reported for failed calls."""
+        history.on_event(Event(
+            type=EventType.MCP_TOOL_CALL_ERROR,
+            data={"tool_call_id": tool_call_id, "function_name": "tool", "arguments": {},
+                  "result": None, "error": "Tool failed"},
+            provider=provider
+        ))
+
+    def _answer(self, history, provider, content):
+        """Publish a complete assistant answer from the given provider."""
+        history.on_event(Event(type=EventType.CONTENT, data={"content": content}, provider=provider))
+        history.on_event(Event(type=EventType.FINISH, data={}, provider=provider))
+
+    @regression_test
+    def test_unavailable_provider_does_not_block_sync(self):
+        """Test that switching to a provider that cannot format tool calls skips only those entries."""
+        history = MessageHistory()
+        history.add_user_message("first")
+        self._dispatch_tool_call(history, ELLMProvider.OLLAMA, "call-1")
+
+        # The tool call cannot be formatted for the provider, the other entries still sync
+        self.failing_providers.add(ELLMProvider.OPENAI)
+        self._answer(history, ELLMProvider.OPENAI, "from openai")
+        history.add_user_message("second")
+        self.assertEqual(
+            [message.get("content") for message in history.get_provider_history()],
+            ["first", "from openai", "second"]
+        )
+
+        # Switching back adds only the new entries, without duplicates
+        self.failing_providers.clear()
+        self._answer(history, ELLMProvider.OLLAMA, "from ollama")
+        ollama_history = history.get_provider_history()
+        self.assertEqual(len(ollama_history), len(history))
+        self.assertEqual(ollama_history[1]["tool_calls"], [{"id": "call-1", "provider": "ollama"}])
+        self.assertEqual(
+            [message.get("content") for message in ollama_history],
+            ["first", None, "from openai", "second", "from ollama"]
+        )
+
+    @regression_test
+    def test_tool_error_without_result_does_not_block_sync(self):
+        """Test that a tool error without a result does not stop later messages from syncing."""
+        history = MessageHistory()
+        history.add_user_message("first")
+        self._dispatch_tool_call(history, ELLMProvider.OLLAMA, "call-1")
+        self._fail_tool_call(history, ELLMProvider.OLLAMA, "call-1")
+
+        history.add_user_message("second")
+        self._answer(history, ELLMProvider.OLLAMA, "answer")
+
+        ollama_history = history.get_provider_history()
+        self.assertEqual(
+            [message.get("content") for message in ollama_history],
+            ["first", None, "second", "answer"]
+        )
+        self.assertEqual(len(history), 5, "The error should stay in the canonical history")
+
+    @regression_test
+    def test_other_provider_history_is_a_copy(self):
+        """Test that the history of another provider cannot be changed by the caller."""
+        history = MessageHistory()
+        history.add_user_message("hello")
+        self._answer(history, ELLMProvider.OLLAMA, "answer")
+
+        other_history = history.get_provider_history(ELLMProvider.OPENAI)
+        other_history.append({"role": "user", "content": "injected"})
+
+        self.assertEqual(len(history.get_provider_history(ELLMProvider.OPENAI)), len(history))
+
+
+def run_regression_tests():
+    """Run all regression tests for message history."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Add all test cases
+    suite.addTests(loader.loadTestsFromTestCase(TestMessageHistoryRegression))
+
+    # Run tests
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    return result.wasSuccessful()
+
+if __name__ == "__main__":
+    success = run_regression_tests()
+    if success:
+        print("All regression tests passed!")
+    else:
+        print("Some regression tests failed.")
+    exit(0 if success else 1)
@@ -6,6 +6,7 @@ work as expected and remain stable across updates.
 
 
 import os
+import json
 import tempfile
 from pathlib import Path
 import unittest
@@ -79,6 +80,46 @@ class TestPersistentSettingsRegression(unittest.TestCase):
         self.assertIn('file-content-test-ip', content, "Saved IP value should appear in settings file")
         self.assertIn('54321', content, "Saved port value should appear in settings file")
 
+    @regression_test
+    def test_import_settings_partial_failure(self):
+        """Test that an invalid value in an imported category does not block the valid ones."""
+        os.environ['HATCHLING_SETTINGS_DIR'] = str(Path(self.temp_dir.name) / "settings")
+        registry = SettingsRegistry()
+        original_port = registry.get_setting('ollama', 'port')['current_value']
+        data = '[ollama]\nip = "partial-import-ip"\nport = "not-a-port"\nunknown = 1\n\n[paths]\nhatchling_cache_dir = "/tmp"\n'
+        report = registry.import_settings(data, "toml", force=True)
+        self.assertEqual(report["successful"], ["ollama:ip"], "Only the valid setting should be imported")
+        self.assertEqual(len(report["failed"]), 2, "Invalid and unknown settings should be reported as failed")
+        self.assertEqual(len(report["skipped"]), 1, "Read-only settings should be skipped")
+        self.assertEqual(registry.get_setting('ollama', 'ip')['current_value'], 'partial-import-ip')
+        self.assertEqual(registry.get_setting('ollama', 'port')['current_value'], original_port)
+
+    @regression_test
+    def test_filtered_listing_reflects_updates(self):
+        """Test that repeated filtered listings report the current values after a setting changes."""
+        os.environ['HATCHLING_SETTINGS_DIR'] = str(Path(self.temp_dir.name) / "settings")
+        registry = SettingsRegistry(load_persistent=False)
+        first = registry.list_settings("ollama")
+        registry.set_setting('ollama', 'ip', 'filtered-listing-ip', True)
+        second = registry.list_settings("ollama")
+        self.assertEqual([s['name'] for s in first], [s['name'] for s in second], "Matches should not change")
+        ip = next(s for s in second if s['name'] == 'ip')
+        self.assertEqual(ip['current_value'], 'filtered-listing-ip', "Listing should show the updated value")
+
+    @regression_test
+    def test_settings_are_plain_dicts(self):
+        """Test that listed and fetched settings are plain, JSON-serializable dictionaries."""
+        os.environ['HATCHLING_SETTINGS_DIR'] = str(Path(self.temp_dir.name) / "settings")
+        registry = SettingsRegistry(load_persistent=False)
+        setting = registry.get_setting('ollama', 'port')
+        self.assertIsInstance(setting, dict)
+        self.assertEqual(json.loads(json.dumps(setting))['current_value'], setting['current_value'])
+        for listed in (registry.list_settings(), registry.list_settings("ollama")):
+            self.assertTrue(all(isinstance(s, dict) for s in listed), "Listed settings should be dicts")
+        setting['current_value'] = 'changed'
+        self.assertNotEqual(registry.get_setting('ollama', 'port')['current_value'], 'changed',
+                            "Changing a returned setting should not affect the registry")
+
 def run_regression_tests():
     """Run all regression tests for persistent settings."""
     loader = unittest.TestLoader()